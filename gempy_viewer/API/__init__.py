@@ -1,6 +1,6 @@
 import warnings
 
-from ._plot_2d_API import plot_2d, plot_section_traces, plot_topology 
+from ._plot_2d_API import plot_2d, plot_2d_pages, plot_section_traces, plot_topology 
 from ._plot_LiquidEarth import plot_to_liquid_earth
 # check if pyvista is installed
 try:
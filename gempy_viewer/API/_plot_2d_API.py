@@ -7,8 +7,10 @@ from gempy.core.data import GeoModel
 from gempy.core.data.grid_modules import RegularGrid
 from gempy_viewer.API._plot_2d_sections_api import plot_sections
 from gempy_viewer.core.data_to_show import DataToShow
+from gempy_viewer.core.input_data_arrays import InputDataArrays
 from gempy_viewer.core.section_data_2d import SectionData2D
-from gempy_viewer.modules.plot_2d.multi_axis_manager import sections_iterator, orthogonal_sections_iterator
+from gempy_viewer.modules.plot_2d.multi_axis_manager import sections_iterator, orthogonal_sections_iterator, \
+    create_panel_grid
 from gempy_viewer.modules.plot_2d.visualization_2d import Plot2D
 
 
@@ -51,6 +53,10 @@ def plot_2d(model: GeoModel,
             * hillshade (bool): Calculate and add hillshading using elevation data.
             * azdeg (float): Azimuth of sun for hillshade.
             - altdeg (float): Altitude in degrees of sun for hillshade.
+            * contour_levels (list): Heights of the contour lines. By default round numbers over the heights.
+            * contour_interval (float): Spacing of the contour lines if no levels are given.
+            * supersample (bool): Resample the heights to the pixels of the axes when the DEM is
+              coarser than them. Defaults to True.
         kwargs_lithology (Optional[dict]): Additional keyword arguments for lithology.
         kwargs_scalar_field (Optional[dict]): Additional keyword arguments for scalar field.
 
@@ -65,6 +71,8 @@ def plot_2d(model: GeoModel,
         show_boundaries (bool): Show surface boundaries as lines. Defaults to True.
         show_topography (bool): Show topography on plot. Defaults to False.
         show_section_traces (bool): Show section traces. Defaults to True.
+        input_arrays (InputDataArrays): Input data of the model shared with other figures, e.g. the
+            pages of :func:`plot_2d_pages`. Read from the model by default.
 
     Returns:
         gempy.plot.visualization_2d.Plot2D: Plot2D object.
@@ -124,24 +132,23 @@ def plot_2d(model: GeoModel,
         show_block=kwargs.get('show_block', False)
     )
 
-    # is 10 and 10 because in the ax pos is the second digit
-    n_columns_ = 1 if len(section_names) + len(cell_number) < 2 else 2
-    n_columns = n_columns_ * 10  # This is for the axis location syntax
-    n_rows = (len(section_names) + len(cell_number)) / n_columns_
-
-    n_columns_ = np.max([n_columns_, 1])
-    n_rows = np.max([n_rows, 1])
+    n_panels = len(section_names) + len(cell_number)
+    n_columns = 1 if n_panels < 2 else 2
+    n_rows = np.max([n_panels / n_columns, 1])
 
     p = Plot2D()
-    p.create_figure(cols=n_columns_, rows=n_rows, **kwargs)  # * This creates fig and axes
+    p.create_figure(cols=n_columns, rows=n_rows, **kwargs)  # * This creates fig and axes
+    grid_spec = create_panel_grid(plot_2d=p, n_axis=max(n_axis, n_panels), n_columns=n_columns)
+    # * Input data read once and shared by all the sections
+    input_arrays = kwargs.get('input_arrays', None) or InputDataArrays.from_geo_model(model)
     section_data_list: list[SectionData2D] = sections_iterator(
         plot_2d=p,
         gempy_model=model,
         sections_names=section_names,
-        n_axis=n_axis,
-        n_columns=n_columns,
+        grid_spec=grid_spec,
         ve=ve,
-        projection_distance=kwargs.get('projection_distance', 0.2 * model.input_transform.isometric_scale)
+        projection_distance=kwargs.get('projection_distance', 0.2 * model.input_transform.isometric_scale),
+        input_arrays=input_arrays
     )
 
     orthogonal_section_data_list: list[SectionData2D] = orthogonal_sections_iterator(
@@ -150,14 +157,16 @@ def plot_2d(model: GeoModel,
         gempy_model=model,
         direction=direction,
         cell_number=cell_number,
-        n_axis=n_axis,
-        n_columns=n_columns,
+        grid_spec=grid_spec,
         ve=ve,
-        projection_distance=kwargs.get('projection_distance', 0.2 * model.input_transform.isometric_scale)
+        projection_distance=kwargs.get('projection_distance', 0.2 * model.input_transform.isometric_scale),
+        input_arrays=input_arrays
     )
 
     section_data_list.extend(orthogonal_section_data_list)
     p.section_data_list = section_data_list
+    # * Layout computed once with all the axes in place
+    p.fig.tight_layout()
 
     plot_sections(
         gempy_model=model,
@@ -170,7 +179,8 @@ def plot_2d(model: GeoModel,
         kwargs_topography=kwargs_topography,
         kwargs_scalar_field=kwargs_scalar_field,
         kwargs_lithology=kwargs_lithology,
-        kwargs_boundaries=kwargs_boundaries
+        kwargs_boundaries=kwargs_boundaries,
+        slice_cache=p.slice_cache
     )
     if show is True and plt.get_backend().lower() != "agg":
         p.fig.show()
@@ -178,6 +188,85 @@ def plot_2d(model: GeoModel,
     return p
 
 
+def plot_2d_pages(model: GeoModel,
+                  section_names: list = None,
+                  cell_number: Optional[Union[int | list[int] | str | list[str]]] = None,
+                  direction: Optional[Union[str | list[str]]] = 'y',
+                  panels_per_page: int = 12,
+                  pdf_path: Optional[str] = None,
+                  **kwargs) -> list[Plot2D]:
+    """Plot many 2-D sections of the geomodel as a sequence of figures.
+
+    The custom sections and then the cell numbers are split in pages of up to ``panels_per_page``
+    panels, each drawn by :func:`plot_2d` with the remaining arguments. The input data are read once
+    for all the pages. Arguments given per panel (``series_n`` and the ``show_*`` lists with one value
+    per panel) are split with the panels, the rest are passed unchanged to every page.
+
+    Args:
+        model (GeoModel): Geomodel object with solutions.
+        section_names (Optional[List[str]]): Names of predefined custom section traces.
+        cell_number (Optional[Union[int, List[int], str, List[str]]]): Position of the array to plot.
+        direction (Optional[Union[str, List[str]]]): Cartesian direction to be plotted (xyz).
+        panels_per_page (int): Maximum number of panels of each figure. Defaults to 12.
+        pdf_path (Optional[str]): If given, the pages are saved to this file as a multipage pdf.
+        **kwargs: Arguments of :func:`plot_2d`.
+
+    Returns:
+        list[Plot2D]: One Plot2D object per page.
+    """
+    if panels_per_page < 1:
+        raise ValueError('panels_per_page must be at least 1.')
+
+    if section_names is None and cell_number is None and direction is not None:
+        cell_number = ['mid']
+    section_names = [] if section_names is None else list(np.atleast_1d(section_names))
+    cell_number = [] if cell_number is None else cell_number
+    if type(cell_number) != list:
+        cell_number = [cell_number]
+    direction = [] if direction is None else direction
+    if type(direction) != list:
+        direction = [direction] * len(cell_number)
+
+    # * Custom sections go first, as in plot_2d
+    panels = [(name, None, None) for name in section_names] + list(zip([None] * len(cell_number), cell_number, direction))
+    n_panels = len(panels)
+    show = kwargs.pop('show', True)
+    kwargs.setdefault('input_arrays', InputDataArrays.from_geo_model(model))
+
+    pages = []
+    for first in range(0, n_panels, panels_per_page):
+        page_panels = panels[first:first + panels_per_page]
+        page_kwargs = {
+            key: value[first:first + panels_per_page] if _is_per_panel(key, value, n_panels) else value
+            for key, value in kwargs.items()
+        }
+        pages.append(plot_2d(
+            model=model,
+            section_names=[name for name, _, _ in page_panels if name is not None],
+            cell_number=[cell for name, cell, _ in page_panels if name is None],
+            direction=[dir_ for name, _, dir_ in page_panels if name is None],
+            show=False,
+            **page_kwargs
+        ))
+
+    if pdf_path is not None:
+        from matplotlib.backends.backend_pdf import PdfPages
+        with PdfPages(pdf_path) as pdf:
+            for page in pages:
+                pdf.savefig(page.fig)
+
+    if show is True and plt.get_backend().lower() != "agg":
+        for page in pages:
+            page.fig.show()
+
+    return pages
+
+
+def _is_per_panel(key: str, value, n_panels: int) -> bool:
+    # * Only these arguments are given per panel, other lists (e.g. figsize) apply to every page
+    return (key == 'series_n' or key.startswith('show_')) and isinstance(value, list) and len(value) == n_panels
+
+
 def plot_section_traces(model: GeoModel, section_names: list[str] = None):
     """
     Plot section traces of section grid in 2-D topview (xy).
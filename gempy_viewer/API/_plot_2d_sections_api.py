@@ -1,17 +1,18 @@
-﻿import warnings
-from typing import Optional
+﻿from typing import Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
 
 from gempy.core.data import GeoModel
 from gempy_viewer.core.data_to_show import DataToShow
+from gempy_viewer.core.ids_mapping import first_appearance_rank
+from gempy_viewer.core.lru_cache import LRUCache
 from gempy_viewer.core.section_data_2d import SectionData2D, SectionType
-from ..modules.plot_2d.drawer_contours_2d import plot_regular_grid_contacts
+from ..modules.plot_2d.drawer_contours_2d import plot_regular_grid_contacts, plot_section_contacts, section_contact_lines
 from ..modules.plot_2d.drawer_input_2d import draw_data
 from ..modules.plot_2d.drawer_regular_grid_2d import plot_section_area, plot_regular_grid_area
 from ..modules.plot_2d.drawer_scalar_field_2d import plot_section_scalar_field, plot_regular_grid_scalar_field
-from ..modules.plot_2d.drawer_topography_2d import plot_topography
+from ..modules.plot_2d.drawer_topography_2d import plot_topography, section_topography_profiles
 from ..modules.plot_2d.drawer_traces_2d import plot_section_traces
 from ..modules.plot_2d.plot_2d_utils import get_geo_model_cmap, get_geo_model_norm
 
@@ -26,6 +27,7 @@ def plot_sections(gempy_model: GeoModel, sections_data: list[SectionData2D], dat
                   kwargs_boundaries: dict = None,
                   kwargs_surface_points: dict = None,
                   kwargs_orientations: dict = None,
+                  slice_cache: Optional[LRUCache] = None
                   ):
     kwargs_lithology = kwargs_lithology if kwargs_lithology is not None else {}
     kwargs_scalar_field = kwargs_scalar_field if kwargs_scalar_field is not None else {}
@@ -37,16 +39,33 @@ def plot_sections(gempy_model: GeoModel, sections_data: list[SectionData2D], dat
     
     legend_already_added = False
 
+    surface_points_colors, orientations_colors = _data_colors_per_item(gempy_model)
+
+    # * Contacts of all the custom sections extracted at once from the sections solution
+    section_contacts = {}
+    contact_section_names = [
+        section_data.section_name for e, section_data in enumerate(sections_data)
+        if section_data.section_type is SectionType.SECTION and data_to_show.show_boundaries[e] is True
+    ]
+    if len(contact_section_names) > 0:
+        section_contacts = section_contact_lines(
+            gempy_model=gempy_model,
+            section_names=contact_section_names,
+            contour_colors=(kwargs_boundaries or {}).get('contour_colors', None)
+        )
+
+    topography_profiles = {}
+    if gempy_model.grid.topography is not None and any(data_to_show.show_topography):
+        topography_profiles = section_topography_profiles(gempy_model.grid, sections_data)
+
     for e, section_data in enumerate(sections_data):
         temp_ax = section_data.ax
         # region plot methods
         if data_to_show.show_data[e] is True:
             draw_data(
                 ax=temp_ax,
-                surface_points_colors=gempy_model.structural_frame.surface_points_colors_per_item,
-                orientations_colors=gempy_model.structural_frame.orientations_colors_per_item,
-                orientations=gempy_model.orientations_copy.df.copy(),
-                points=gempy_model.surface_points_copy.df.copy(),
+                surface_points_colors=surface_points_colors,
+                orientations_colors=orientations_colors,
                 slicer_data=section_data.slicer_data,
                 kwargs_surface_points=kwargs_surface_points,
                 kwargs_orientations=kwargs_orientations,
@@ -81,7 +100,8 @@ def plot_sections(gempy_model: GeoModel, sections_data: list[SectionData2D], dat
                         resolution=gempy_model.grid.regular_grid.resolution,
                         cmap=cmap,
                         norm=norm,
-                        imshow_kwargs=kwargs_lithology
+                        imshow_kwargs=kwargs_lithology,
+                        slice_cache=slice_cache
                     )
                 case _:
                     raise ValueError(f'Unknown section type: {section_data.section_type}')
@@ -94,7 +114,8 @@ def plot_sections(gempy_model: GeoModel, sections_data: list[SectionData2D], dat
                         ax=temp_ax,
                         section_name=section_data.section_name,
                         series_n=series_n[e],
-                        kwargs=kwargs_scalar_field
+                        kwargs=kwargs_scalar_field,
+                        slice_cache=slice_cache
                     )
                 case SectionType.ORTHOGONAL:
                     plot_regular_grid_scalar_field(
@@ -102,18 +123,21 @@ def plot_sections(gempy_model: GeoModel, sections_data: list[SectionData2D], dat
                         slicer_data=section_data.slicer_data,
                         block=gempy_model.solutions.raw_arrays.scalar_field_matrix[series_n[e]],
                         resolution=gempy_model.grid.regular_grid.resolution,
-                        kwargs=kwargs_scalar_field
+                        kwargs=kwargs_scalar_field,
+                        slice_cache=slice_cache
                     )
                 case _:
                     raise ValueError(f'Unknown section type: {section_data.section_type}')
         if data_to_show.show_boundaries[e] is True:
             match section_data.section_type:
                 case SectionType.SECTION:
-                    warnings.warn(
-                        message='Section contacts not implemented yet. We need to pass scalar field for the sections grid',
-                        category=UserWarning
+                    plot_section_contacts(
+                        gempy_model=gempy_model,
+                        ax=temp_ax,
+                        section_name=section_data.section_name,
+                        kwargs=kwargs_boundaries,
+                        contact_lines=section_contacts[section_data.section_name]
                     )
-                    pass
                 case SectionType.ORTHOGONAL:
                     plot_regular_grid_contacts(
                         gempy_model=gempy_model,
@@ -121,7 +145,8 @@ def plot_sections(gempy_model: GeoModel, sections_data: list[SectionData2D], dat
                         slicer_data=section_data.slicer_data,
                         resolution=gempy_model.grid.regular_grid.resolution,
                         only_faults=False,
-                        kwargs=kwargs_boundaries 
+                        kwargs=kwargs_boundaries,
+                        slice_cache=slice_cache
                     )
                 case _:
                     raise ValueError(f'Unknown section type: {section_data.section_type}')
@@ -137,6 +162,10 @@ def plot_sections(gempy_model: GeoModel, sections_data: list[SectionData2D], dat
                 ax=temp_ax,
                 fill_contour=fill_contour,
                 section_name=section_data.section_name,
+                profile=topography_profiles.get(
+                    section_data.section_name if section_data.section_name is not None
+                    else (section_data.direction, section_data.cell_number)
+                ),
                 **kwargs_topography
             )
 
@@ -178,3 +207,25 @@ def plot_sections(gempy_model: GeoModel, sections_data: list[SectionData2D], dat
             temp_ax.set_aspect(ve)
 
     return
+
+
+def _data_colors_per_item(gempy_model: GeoModel) -> tuple[np.ndarray, np.ndarray]:
+    """Color of every surface point and orientation, looked up from the id of its structural element."""
+    structural_elements = gempy_model.structural_frame.structural_elements
+    elements_ids = [element.id for element in structural_elements]
+    elements_colors = np.array([element.color for element in structural_elements])
+
+    surface_points_colors = _colors_per_id(elements_ids, elements_colors, gempy_model.surface_points_copy.ids, 'surface points')
+    orientations_colors = _colors_per_id(elements_ids, elements_colors, gempy_model.orientations_copy.ids, 'orientations')
+    return surface_points_colors, orientations_colors
+
+
+def _colors_per_id(elements_ids: list, elements_colors: np.ndarray, ids: np.ndarray, data_name: str) -> np.ndarray:
+    rank = first_appearance_rank(elements_ids, ids)
+    unknown = rank == -1
+    if np.any(unknown):
+        raise ValueError(
+            f"Found {np.sum(unknown)} {data_name} whose id does not belong to any structural element: "
+            f"{np.unique(np.asarray(ids)[unknown]).tolist()}"
+        )
+    return elements_colors[rank]
@@ -44,6 +44,7 @@ def plot_3d(
         show: bool = True,
         transformed_data: bool = False,
         show_nugget_effect: bool = False,
+        all_scalar_fields: bool = False,
         **kwargs
 ) -> GemPyToVista:
     """
@@ -83,6 +84,9 @@ def plot_3d(
         of raw data. Defaults to False.
     :param show_nugget_effect: Boolean flag that determines if the nugget effect data should be visualized. 
         Defaults to False.
+    :param all_scalar_fields: Boolean flag to build a single regular grid holding the lithology, every scalar 
+        field and every values array. The shown field can then be switched with 
+        `set_active_regular_grid_field` without rebuilding the grid. Defaults to False.
     :param kwargs: Additional keyword arguments for extended functionality. Optional dictionary 
         of miscellaneous settings or configurations.
     :return: A GemPyToVista object containing the generated visualization configuration and state.
@@ -147,7 +151,6 @@ def plot_3d(
             solution=solutions_raw_arrays,
             topography_scalar_type=topography_scalar_type,
             elements_colors=structural_frame.elements_colors[::-1],
-            contours=kwargs_plot_topography.get('contours', True),
             **kwargs_plot_topography
         )
         
@@ -190,36 +193,63 @@ def plot_3d(
     elif show_nugget_effect is True:
         raise ValueError("Data plotting is disabled. Please set show_data=True to plot nugget.")
 
-    if transformed_data:
-        vtk_formated_regular_mesh = model.regular_grid_coordinates_transformed
-    else:
-        vtk_formated_regular_mesh = model.regular_grid_coordinates
+    # * The grid geometry is cached in the drawer, so it is not materialized on every call
+    regular_grid = model.grid.regular_grid
+    regular_grid_input_transform = model.input_transform if transformed_data else None
 
-    if data_to_show.show_lith[0] is True:
-        plot_structured_grid(
-            gempy_vista=gempy_vista,
-            vtk_formated_regular_mesh=vtk_formated_regular_mesh,
-            resolution=model.grid.regular_grid.resolution,
-            scalar_data_type=ScalarDataType.LITHOLOGY,
-            active_scalar_field="lith",
-            solution=solutions_raw_arrays,
-            cmap=get_geo_model_cmap(structural_frame.volume_elements_colors, reverse=False),
-            **kwargs_plot_structured_grid
-        )
+    if all_scalar_fields is True and (data_to_show.show_lith[0] is True or data_to_show.show_scalar[0] is True):
+        # * One grid holding every field. Switch between them with set_active_regular_grid_field
+        if data_to_show.show_scalar[0] is True:
+            active_field, cmap = active_scalar_field or 'sf_0', 'magma'
+        else:
+            active_field, cmap = 'lith', get_geo_model_cmap(structural_frame.volume_elements_colors, reverse=False)
 
-    if data_to_show.show_scalar[0] is True:
-        # TODO: Make sure that when we are ere we do not change the scalar_bar
         plot_structured_grid(
             gempy_vista=gempy_vista,
-            vtk_formated_regular_mesh=vtk_formated_regular_mesh,
-            resolution=model.grid.regular_grid.resolution,
-            scalar_data_type=ScalarDataType.SCALAR_FIELD,
-            active_scalar_field=active_scalar_field,
+            vtk_formated_regular_mesh=None,
+            resolution=regular_grid.resolution,
+            regular_grid=regular_grid,
+            input_transform=regular_grid_input_transform,
+            topography=model.grid.topography,
+            scalar_data_type=ScalarDataType.ALL,
+            active_scalar_field=active_field,
             solution=solutions_raw_arrays,
-            cmap='magma',
+            cmap=cmap,
             **kwargs_plot_structured_grid
         )
-    else: # * If it is not a scalar field, we use the structural frame bar
+    else:
+        if data_to_show.show_lith[0] is True:
+            plot_structured_grid(
+                gempy_vista=gempy_vista,
+                vtk_formated_regular_mesh=None,
+                resolution=regular_grid.resolution,
+                regular_grid=regular_grid,
+                input_transform=regular_grid_input_transform,
+                topography=model.grid.topography,
+                scalar_data_type=ScalarDataType.LITHOLOGY,
+                active_scalar_field="lith",
+                solution=solutions_raw_arrays,
+                cmap=get_geo_model_cmap(structural_frame.volume_elements_colors, reverse=False),
+                **kwargs_plot_structured_grid
+            )
+
+        if data_to_show.show_scalar[0] is True:
+            # TODO: Make sure that when we are ere we do not change the scalar_bar
+            plot_structured_grid(
+                gempy_vista=gempy_vista,
+                vtk_formated_regular_mesh=None,
+                resolution=regular_grid.resolution,
+                regular_grid=regular_grid,
+                input_transform=regular_grid_input_transform,
+                topography=model.grid.topography,
+                scalar_data_type=ScalarDataType.SCALAR_FIELD,
+                active_scalar_field=active_scalar_field,
+                solution=solutions_raw_arrays,
+                cmap='magma',
+                **kwargs_plot_structured_grid
+            )
+
+    if data_to_show.show_scalar[0] is not True:  # * If it is not a scalar field, we use the structural frame bar
         if data_to_show.show_lith[0] is True:
             set_scalar_bar(
                 gempy_vista=gempy_vista,
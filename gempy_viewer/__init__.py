@@ -2,7 +2,7 @@ import sys
 
 from gempy_viewer.modules.plot_3d.vista import GemPyToVista
 from .API import *
-__all__ = ['plot_2d', 'plot_3d', 'plot_section_traces', 'plot_topology', 'plot_stereonet']
+__all__ = ['plot_2d', 'plot_2d_pages', 'plot_3d', 'plot_section_traces', 'plot_topology', 'plot_stereonet']
 
 
 # Assert at least pyton 3.10
@@ -0,0 +1,80 @@
+from typing import Sequence
+
+import numpy as np
+
+
+def contour_lines(x: np.ndarray, y: np.ndarray, z: np.ndarray, levels: Sequence[float]) -> list[list[np.ndarray]]:
+    """Isolines of ``z`` (ny, nx) on the ``x`` (nx) and ``y`` (ny) coordinates, for all ``levels`` in one pass.
+
+    Returns, for every level, a list of (n, 2) arrays with the vertices of each line. The arrays do not
+    depend on any plotting backend, so they can be cached and drawn both in 2D and 3D.
+    """
+    import contourpy
+
+    generator = contourpy.contour_generator(x=x, y=y, z=z, line_type=contourpy.LineType.Separate)
+    if len(levels) == 0:
+        return []
+    return generator.multi_lines(levels)
+
+
+def image_contour_lines(image: np.ndarray, levels: Sequence[float], extent: Sequence[float]) -> list[list[np.ndarray]]:
+    """Isolines of an image drawn with ``origin='lower'`` over ``extent``, placing the values at the pixel
+    centers as ``imshow`` and ``ax.contour`` do."""
+    x0, x1, y0, y1 = extent
+    ny, nx = image.shape
+    x = x0 + (np.arange(nx) + 0.5) * (x1 - x0) / nx
+    y = y0 + (np.arange(ny) + 0.5) * (y1 - y0) / ny
+    return contour_lines(x, y, image, levels)
+
+
+def contour_overlay(image: np.ndarray, extent: Sequence[float], levels=None,
+                    dtype=np.float32) -> tuple[np.ndarray, list[list[np.ndarray]], list[list[np.ndarray]], list[list[np.ndarray]]]:
+    """Isolines and filled bands of an image drawn as ``ax.contour(image, extent=extent)`` would, from a
+    single contour generator.
+
+    ``levels`` is a number of levels or the levels themselves. By default, round levels spanning the
+    image are picked as matplotlib does, so both overlays share them. The image is read in ``dtype``,
+    float32 by default.
+
+    Returns the levels, the lines of every level and, for every band between two levels, the vertices
+    and the path codes of its polygons, ready for :class:`matplotlib.contour.ContourSet`.
+    """
+    import contourpy
+
+    image = np.asarray(image, dtype=dtype)
+    levels = image_contour_levels(image, levels)
+
+    # * Without origin, matplotlib places the first and last values on the corners of the extent
+    x0, x1, y0, y1 = extent
+    ny, nx = image.shape
+    generator = contourpy.contour_generator(
+        x=np.linspace(x0, x1, nx),
+        y=np.linspace(y0, y1, ny),
+        z=image,
+        line_type=contourpy.LineType.Separate,
+        fill_type=contourpy.FillType.OuterCode
+    )
+    lines = generator.multi_lines(levels)
+    filled = generator.multi_filled(levels) if len(levels) > 1 else []
+    return levels, lines, [polygons for polygons, _ in filled], [codes for _, codes in filled]
+
+
+def image_contour_levels(image: np.ndarray, levels=None) -> np.ndarray:
+    """Levels of ``levels`` contours spanning ``image``, following ``ContourSet`` (7 by default)."""
+    if levels is not None and not np.isscalar(levels):
+        return np.asarray(levels, dtype=float)
+
+    from matplotlib.ticker import MaxNLocator
+
+    z_min, z_max = float(np.nanmin(image)), float(np.nanmax(image))
+    n_levels = 7 if levels is None else int(levels)
+    candidates = MaxNLocator(n_levels + 1, min_n_ticks=1).tick_values(z_min, z_max)
+
+    # * Keep a single level below and above the image
+    under = np.nonzero(candidates < z_min)[0]
+    over = np.nonzero(candidates > z_max)[0]
+    i0 = under[-1] if len(under) else 0
+    i1 = over[0] + 1 if len(over) else len(candidates)
+    if i1 - i0 < 3:
+        i0, i1 = 0, len(candidates)
+    return candidates[i0:i1]
@@ -0,0 +1,42 @@
+import warnings
+
+import numpy as np
+
+
+def first_appearance_rank(mapping_ids: np.ndarray, ids_to_map: np.ndarray) -> np.ndarray:
+    """Rank of each id in ``ids_to_map`` by the order its value first appears in ``mapping_ids``.
+
+    The first value appearing in ``mapping_ids`` gets rank 0, the second one 1 and so on. Ids not
+    present in ``mapping_ids`` get -1. It is a sorted lookup, so it scales to millions of ids.
+    """
+    mapping_ids = np.asarray(mapping_ids)
+    ids_to_map = np.asarray(ids_to_map)
+
+    unique_values, first_indices = np.unique(mapping_ids, return_index=True)
+    if unique_values.shape[0] == 0:
+        return np.full(ids_to_map.shape, -1, dtype=np.int64)
+
+    ranks = np.empty(unique_values.shape[0], dtype=np.int64)
+    ranks[np.argsort(first_indices)] = np.arange(unique_values.shape[0])
+
+    positions = np.searchsorted(unique_values, ids_to_map).clip(max=unique_values.shape[0] - 1)
+    found = unique_values[positions] == ids_to_map
+    return np.where(found, ranks[positions], -1)
+
+
+def vectorize_ids(mapping_ids: np.ndarray, ids_to_map: np.ndarray) -> np.ndarray:
+    """Map ids to 1..n by reversed order of first appearance in ``mapping_ids``. Missing ids map to 0.
+
+    The order is flipped to please the pyvista vertical scalar bar.
+    """
+    n_values = np.unique(mapping_ids).shape[0]
+    rank = first_appearance_rank(mapping_ids, ids_to_map)
+
+    valid_mask = rank != -1
+    if not np.all(valid_mask):
+        warnings.warn(
+            f"Found {np.sum(~valid_mask)} orientation IDs that don't exist in surface points. "
+            f"These will be assigned a default value of 0."
+        )
+
+    return np.where(valid_mask, n_values - rank, 0)
@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from gempy_viewer.optional_dependencies import require_scipy
+
+MAX_SEGMENT_SAMPLES = 4096
+
+
+@dataclass(frozen=True)
+class InputDataArrays:
+    """Coordinates of the input data read once from the model and shared by all the 2D panels.
+
+    The arrays are read only: every section projects them into new arrays instead of modifying them.
+    KD-trees over the horizontal coordinates are built on first use, so selecting the data close to
+    each section is a tree query instead of a scan over all the data.
+    """
+    points_xyz: np.ndarray
+    orientations_xyz: np.ndarray
+    orientations_gradients: np.ndarray
+
+    @classmethod
+    def from_geo_model(cls, gempy_model) -> 'InputDataArrays':
+        surface_points = gempy_model.surface_points_copy
+        orientations = gempy_model.orientations_copy
+        return cls(
+            points_xyz=_read_only(surface_points.xyz),
+            orientations_xyz=_read_only(orientations.xyz),
+            orientations_gradients=_read_only(orientations.grads)
+        )
+
+    @cached_property
+    def points_xy_tree(self):
+        return require_scipy().spatial.cKDTree(self.points_xyz[:, :2])
+
+    @cached_property
+    def orientations_xy_tree(self):
+        return require_scipy().spatial.cKDTree(self.orientations_xyz[:, :2])
+
+    @cached_property
+    def points_sorted_xyz(self) -> tuple[np.ndarray, np.ndarray]:
+        """Order and values, (3, n), of the point coordinates sorted along each axis."""
+        return _sorted_along_axes(self.points_xyz)
+
+    @cached_property
+    def orientations_sorted_xyz(self) -> tuple[np.ndarray, np.ndarray]:
+        return _sorted_along_axes(self.orientations_xyz)
+
+    def select_in_slab(self, axis: int, position: float, distance: float) -> tuple[np.ndarray, np.ndarray]:
+        """Masks of the points and orientations whose coordinate along ``axis`` is closer than ``distance``
+        to ``position``, found by binary search on the sorted coordinates."""
+        return (
+            _in_slab(*self.points_sorted_xyz, axis, position, distance),
+            _in_slab(*self.orientations_sorted_xyz, axis, position, distance)
+        )
+
+    def select_near_segment(self, start, stop, distance: float) -> tuple[np.ndarray, np.ndarray]:
+        """Masks of the points and orientations whose horizontal distance to the start-stop segment
+        is below ``distance``."""
+        start, stop = np.asarray(start, dtype=float), np.asarray(stop, dtype=float)
+        return (
+            _near_segment(self.points_xy_tree, self.points_xyz[:, :2], start, stop, distance),
+            _near_segment(self.orientations_xy_tree, self.orientations_xyz[:, :2], start, stop, distance)
+        )
+
+    def select_near_surface(self, surface_xyz: np.ndarray, distance: float) -> tuple[np.ndarray, np.ndarray]:
+        """Masks of the points and orientations closer than ``distance`` to any vertex of ``surface_xyz``."""
+        tree = require_scipy().spatial.cKDTree(surface_xyz)
+        points_dist, _ = tree.query(self.points_xyz, distance_upper_bound=distance)
+        orientations_dist, _ = tree.query(self.orientations_xyz, distance_upper_bound=distance)
+        return points_dist < distance, orientations_dist < distance
+
+
+def _sorted_along_axes(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # * One contiguous row per axis, so the binary search reads only the sorted coordinates
+    order = np.argsort(xyz.T, axis=1, kind='stable')
+    return order, np.take_along_axis(xyz.T, order, axis=1)
+
+
+def _in_slab(order: np.ndarray, sorted_xyz: np.ndarray, axis: int, position: float, distance: float) -> np.ndarray:
+    first = np.searchsorted(sorted_xyz[axis], position - distance, side='right')
+    last = np.searchsorted(sorted_xyz[axis], position + distance, side='left')
+
+    selected = np.zeros(sorted_xyz.shape[1], dtype=bool)
+    selected[order[axis, first:last]] = True
+    return selected
+
+
+def _near_segment(tree, xy: np.ndarray, start: np.ndarray, stop: np.ndarray, distance: float) -> np.ndarray:
+    selected = np.zeros(xy.shape[0], dtype=bool)
+    length = np.linalg.norm(stop - start)
+    if xy.shape[0] == 0 or length == 0:
+        return selected
+
+    # * Balls around samples of the segment cover every candidate, then the exact distance filters them
+    n_samples = int(min(np.ceil(length / max(distance, 1e-12)) + 1, MAX_SEGMENT_SAMPLES))
+    samples = start + np.linspace(0, 1, n_samples)[:, None] * (stop - start)
+    radius = np.hypot(distance, length / (n_samples - 1) / 2)
+    candidates = np.unique(np.concatenate([np.asarray(i, dtype=int) for i in tree.query_ball_point(samples, r=radius)]))
+
+    direction = (stop - start) / length
+    relative = xy[candidates] - start
+    along = relative @ direction
+    across = np.abs(relative[:, 0] * direction[1] - relative[:, 1] * direction[0])
+    selected[candidates[(across < distance) & (along >= 0) & (along <= length)]] = True
+    return selected
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array = np.ascontiguousarray(array, dtype=float)
+    array.setflags(write=False)
+    return array
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """Least recently used cache shared by the drawers to reuse expensive plotting data.
+
+    Entries are evicted when either ``max_size`` entries or ``max_bytes`` (measured with
+    ``size_of``) are exceeded. ``hits`` and ``misses`` count the lookups done through
+    :meth:`get_or_create`.
+    """
+
+    def __init__(self, max_size: int = 8, max_bytes: Optional[int] = None,
+                 size_of: Optional[Callable[[Any], int]] = None):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.size_of = size_of if size_of is not None else _nbytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict = OrderedDict()
+        self._sizes: dict = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def set(self, key: Hashable, value: Any) -> Any:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._sizes[key] = self.size_of(value)
+        self._evict()
+        return value
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        if key in self._entries:
+            self.hits += 1
+            return self.get(key)
+
+        self.misses += 1
+        return self.set(key, factory())
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop ``key`` from the cache, or every entry if no key is given."""
+        if key is None:
+            self._entries.clear()
+            self._sizes.clear()
+        else:
+            self._entries.pop(key, None)
+            self._sizes.pop(key, None)
+
+    def _evict(self):
+        while len(self._entries) > self.max_size:
+            self._pop_oldest()
+        if self.max_bytes is None:
+            return
+        while len(self._entries) > 1 and self.nbytes > self.max_bytes:
+            self._pop_oldest()
+
+    def _pop_oldest(self):
+        key, _ = self._entries.popitem(last=False)
+        self._sizes.pop(key, None)
+
+
+def _nbytes(value: Any) -> int:
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    nbytes = getattr(value, 'nbytes', None)
+    if nbytes is None:
+        nbytes = getattr(value, 'actual_memory_size', 0) * 1024  # * vtk data objects report KiB
+    return int(nbytes)
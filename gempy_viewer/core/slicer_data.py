@@ -15,5 +15,9 @@ class SlicerData:
     regular_grid_x_idx: Optional[int] = None
     regular_grid_y_idx: Optional[int] = None
     regular_grid_z_idx: Optional[int] = None
+    # * Plot coordinates of the selected input data, projected on the section
+    points_xy: Optional[np.ndarray] = None
+    orientations_xy: Optional[np.ndarray] = None
+    orientations_gxy: Optional[np.ndarray] = None
 
 
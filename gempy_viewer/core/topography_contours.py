@@ -0,0 +1,100 @@
+import hashlib
+import weakref
+from typing import Optional, Sequence
+
+import numpy as np
+
+from gempy_viewer.core.contour_lines import contour_lines
+from gempy_viewer.core.lru_cache import LRUCache
+
+topography_contours_cache = LRUCache(max_size=32, max_bytes=256 * 2 ** 20)
+# * id of each hashed values_2d -> (weak reference, layout, checksums, key). Entries go with their arrays
+_topography_keys: dict[int, tuple] = {}
+
+
+def get_topography_contours(topography, levels: Optional[Sequence[float]] = None,
+                            interval: Optional[float] = None) -> tuple[np.ndarray, list[list[np.ndarray]]]:
+    """Isolines of the topography height field, cached by the topography values and the levels.
+
+    Both the 3D and 2D topography drawers read from here, so the same map is contoured only once.
+    ``levels`` are used as given, otherwise they are spaced every ``interval`` or, by default, picked
+    as round numbers covering the heights.
+
+    Returns the levels and, for every level, a list of (n, 2) arrays with the xy vertices of each line.
+    """
+    heights = topography.values_2d[:, :, 2]
+    levels = topography_contour_levels(heights, levels, interval)
+    key = (topography_key(topography), tuple(levels.tolist()))
+    return topography_contours_cache.get_or_create(key, lambda: (levels, _contour_lines(topography, levels)))
+
+
+def topography_contour_levels(heights: np.ndarray, levels: Optional[Sequence[float]] = None,
+                              interval: Optional[float] = None) -> np.ndarray:
+    if levels is not None:
+        return np.asarray(levels, dtype=float)
+
+    z_min, z_max = float(np.nanmin(heights)), float(np.nanmax(heights))
+    if interval is not None:
+        if interval <= 0:
+            raise ValueError(f'The contour interval must be positive, got {interval}.')
+        return np.arange(np.ceil(z_min / interval) * interval, z_max, interval)
+
+    from matplotlib.ticker import MaxNLocator
+    levels = MaxNLocator(nbins=10).tick_values(z_min, z_max)
+    return levels[(levels > z_min) & (levels < z_max)]
+
+
+def topography_key(topography) -> tuple:
+    """Hash of the topography coordinates and heights, cheap compared to contouring them.
+
+    The hash is computed once per array, so the lookups of every drawer and redraw do not hash the
+    whole DEM again. The array is only weakly referenced, so the memo does not keep DEMs alive. Equal
+    heights in another array give the same key. Values edited in place are detected by row and column
+    checksums, much cheaper than the hash, and get a new key.
+    """
+    values_2d = topography.values_2d
+    layout = (values_2d.__array_interface__['data'][0], values_2d.shape, values_2d.strides, values_2d.dtype.str)
+    checksums = _checksums(values_2d)
+
+    entry = _topography_keys.get(id(values_2d), None)
+    if entry is not None:
+        array_ref, entry_layout, entry_checksums, key = entry
+        if array_ref() is values_2d and entry_layout == layout and all(
+                np.array_equal(checksum, entry_checksum) for checksum, entry_checksum in zip(checksums, entry_checksums)):
+            return key
+
+    key = _hash_values(values_2d)
+    array_id = id(values_2d)
+    # * The callback drops the entry when the array is collected, before its id can be reused
+    array_ref = weakref.ref(values_2d, lambda _: _topography_keys.pop(array_id, None))
+    _topography_keys[array_id] = (array_ref, layout, checksums, key)
+    return key
+
+
+def _checksums(values_2d: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # * Wrapping sums of the raw words per row and per column: any changed value, and moved rows or columns,
+    # * change them
+    words = np.ascontiguousarray(values_2d).reshape(values_2d.shape[0], -1)
+    words = words.view(np.uint64) if words.dtype.itemsize == 8 else words.view(np.uint8)
+    return words.sum(axis=1, dtype=np.uint64), words.sum(axis=0, dtype=np.uint64)
+
+
+def _hash_values(values_2d: np.ndarray) -> tuple:
+    values_2d = np.ascontiguousarray(values_2d)
+    return values_2d.shape, hashlib.blake2b(values_2d.view(np.uint8), digest_size=16).hexdigest()
+
+
+def clear_topography_contours_cache():
+    topography_contours_cache.invalidate()
+    _topography_keys.clear()
+
+
+def _contour_lines(topography, levels: np.ndarray) -> list[list[np.ndarray]]:
+    values_2d = topography.values_2d
+    # * values_2d is x major, contour_lines expects the rows along y
+    return contour_lines(
+        x=values_2d[:, 0, 0],
+        y=values_2d[0, :, 1],
+        z=values_2d[:, :, 2].T,
+        levels=levels
+    )
@@ -0,0 +1,90 @@
+from typing import Optional
+
+import numpy as np
+
+from gempy_viewer.core.lru_cache import LRUCache
+from gempy_viewer.core.topography_contours import topography_key
+from gempy_viewer.optional_dependencies import require_skimage
+
+topography_raster_cache = LRUCache(max_size=16, max_bytes=256 * 2 ** 20)
+
+MAX_RASTER_SIZE = 4096
+
+
+def topography_heights(topography, target_shape: Optional[tuple[int, int]] = None) -> np.ndarray:
+    """Heights of the topography as a (ny, nx) image, ready for ``imshow(origin='lower')``.
+
+    If ``target_shape`` (x and y pixels) is denser than the DEM, only the z channel is resampled
+    bicubically to it and memoized per topography. Otherwise the native heights are returned.
+    """
+    heights = topography.values_2d[:, :, 2]
+    target_shape = _upsampled_shape(heights.shape, target_shape)
+    if target_shape is None:
+        return heights.T
+
+    key = (topography_key(topography), target_shape)
+    return topography_raster_cache.get_or_create(key, lambda: _resize_heights(heights, target_shape))
+
+
+def topography_hillshade(topography, azdeg: float = 0, altdeg: float = 0,
+                         target_shape: Optional[tuple[int, int]] = None, dtype=np.float32) -> np.ndarray:
+    """Hillshade of :func:`topography_heights`, memoized per topography, light and resolution.
+
+    Same intensities as :meth:`matplotlib.colors.LightSource.hillshade`, but computed in ``dtype``:
+    float32 by default, which halves the memory of the normals on large DEMs.
+    """
+    heights = topography_heights(topography, target_shape)
+    dtype = np.dtype(dtype)
+    key = (topography_key(topography), float(azdeg), float(altdeg), heights.shape, dtype.str)
+    return topography_raster_cache.get_or_create(key, lambda: _hillshade(heights, azdeg, altdeg, dtype))
+
+
+def axes_pixel_shape(ax) -> tuple[int, int]:
+    """Width and height of ``ax`` in display pixels."""
+    bbox = ax.get_window_extent()
+    return int(np.ceil(bbox.width)), int(np.ceil(bbox.height))
+
+
+def clear_topography_raster_cache():
+    topography_raster_cache.invalidate()
+
+
+def _upsampled_shape(shape: tuple[int, int], target_shape: Optional[tuple[int, int]]) -> Optional[tuple[int, int]]:
+    if target_shape is None:
+        return None
+    target_shape = tuple(int(min(max(t, s), MAX_RASTER_SIZE)) for t, s in zip(target_shape, shape))
+    if target_shape[0] <= shape[0] and target_shape[1] <= shape[1]:
+        return None  # * The DEM is already dense enough for the axes
+    return target_shape
+
+
+def _resize_heights(heights: np.ndarray, target_shape: tuple[int, int]) -> np.ndarray:
+    skimage = require_skimage()
+    resized = skimage.transform.resize(
+        heights,
+        target_shape,
+        order=3,
+        mode='edge',
+        anti_aliasing=True,
+        preserve_range=True
+    )
+    return resized.T
+
+
+def _hillshade(heights: np.ndarray, azdeg: float, altdeg: float, dtype: np.dtype) -> np.ndarray:
+    from matplotlib.colors import LightSource
+
+    # * Like matplotlib, the first row is taken as the top of the image so dy is negative
+    e_dy, e_dx = np.gradient(heights.astype(dtype, copy=False), -1, 1)
+    normals = np.empty(heights.shape + (3,), dtype=dtype)
+    normals[..., 0] = -e_dx
+    normals[..., 1] = -e_dy
+    normals[..., 2] = 1
+    normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+
+    intensity = normals @ LightSource(azdeg=azdeg, altdeg=altdeg).direction.astype(dtype)
+    i_min, i_max = intensity.min(), intensity.max()
+    if (i_max - i_min) > 1e-6:
+        intensity -= i_min
+        intensity /= (i_max - i_min)
+    return np.clip(intensity, 0, 1, out=intensity)
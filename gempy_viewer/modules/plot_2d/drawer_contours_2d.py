@@ -1,12 +1,18 @@
-﻿import matplotlib
+﻿from typing import Optional
+
+import matplotlib
 import numpy as np
+from matplotlib.collections import LineCollection
 
-from gempy.core.data import GeoModel
+from gempy.core.data import GeoModel, Grid
+from gempy_viewer.core.contour_lines import image_contour_lines
+from gempy_viewer.core.lru_cache import LRUCache
 from gempy_viewer.core.slicer_data import SlicerData
+from gempy_viewer.modules.plot_2d.plot_2d_utils import regular_grid_slice, section_scalar_field_image
 
 
 def plot_regular_grid_contacts(gempy_model: GeoModel, ax: matplotlib.axes.Axes, slicer_data: SlicerData, resolution: iter,
-                               only_faults: bool = False, kwargs=None):
+                               only_faults: bool = False, kwargs=None, slice_cache: LRUCache = None):
     if only_faults:
         raise NotImplementedError('Only faults not implemented yet')
     #     contour_idx = list(self.model._faults.df[self.model._faults.df['isFault'] == True].index)
@@ -16,86 +22,97 @@ def plot_regular_grid_contacts(gempy_model: GeoModel, ax: matplotlib.axes.Axes,
         kwargs = {}
 
     zorder = kwargs.get('zorder', 100)
-    contour_colors = kwargs.get('contour_colors', None)
+    line_kwargs = {key: value for key, value in kwargs.items() if key not in ('zorder', 'contour_colors')}
+    extent = (*ax.get_xlim(), *ax.get_ylim())
 
-    shape = resolution
-    c_id = 0  # * color id startpoint
-    all_colors = contour_colors if contour_colors is not None else gempy_model.structural_frame.elements_colors_contacts
+    segments_per_group, colors_per_group = [], []
+    for e, levels, colors in _contact_levels(gempy_model, kwargs.get('contour_colors', None)):
+        block = gempy_model.solutions.raw_arrays.scalar_field_matrix[e]
+        image = regular_grid_slice(block, resolution, slicer_data, slice_cache)
+        lines_per_level = _image_contact_lines(image, levels, extent, slice_cache)
 
-    for e, block in enumerate(gempy_model.solutions.raw_arrays.scalar_field_matrix):
-        _scalar_field_per_surface = np.where(gempy_model.solutions.raw_arrays.scalar_field_at_surface_points[e] != 0)
-        level = gempy_model.solutions.raw_arrays.scalar_field_at_surface_points[e][_scalar_field_per_surface]
-        c_id2 = c_id + len(level)
+        segments_per_group.append([line for lines in lines_per_level for line in lines])
+        colors_per_group.append([color for lines, color in zip(lines_per_level, colors) for _ in lines])
+
+    return _add_contacts_collection(ax, segments_per_group, colors_per_group, zorder, line_kwargs)
+
+
+def plot_section_contacts(gempy_model: GeoModel, ax: matplotlib.axes.Axes, section_name: str, kwargs=None,
+                          contact_lines: Optional[tuple[list, list]] = None):
+    """Contacts on a custom section or the geological map.
+
+    ``contact_lines`` are the lines of this section from :func:`section_contact_lines`, usually extracted
+    for all the sections of the figure at once. They are computed here if not given.
+    """
+    if kwargs is None:
+        kwargs = {}
+
+    zorder = kwargs.get('zorder', 100)
+    line_kwargs = {key: value for key, value in kwargs.items() if key not in ('zorder', 'contour_colors')}
+    if contact_lines is None:
+        contact_lines = section_contact_lines(gempy_model, [section_name], kwargs.get('contour_colors', None))[section_name]
 
-        color_list = all_colors[c_id:c_id2]
+    segments_per_group, colors_per_group = contact_lines
+    return _add_contacts_collection(ax, segments_per_group, colors_per_group, zorder, line_kwargs)
 
-        image = block.reshape(shape)[
-            slicer_data.regular_grid_x_idx,
-            slicer_data.regular_grid_y_idx,
-            slicer_data.regular_grid_z_idx
-        ].T
 
-        contour_set = ax.contour(
-            image,
-            0,
-            levels=np.sort(level),
-            colors=color_list[::-1],
-            linestyles='solid',
-            origin='lower',
-            extent=[*ax.get_xlim(), *ax.get_ylim()],
-            zorder=zorder - (e + len(level)),
-            **kwargs
-        )
+def section_contact_lines(gempy_model: GeoModel, section_names: list[str],
+                          contour_colors: Optional[list[str]] = None) -> dict[str, tuple[list, list]]:
+    """Contact lines of every group on all the given sections, in one pass over the section solutions.
 
+    The scalar field of each group is read once from the sections (or topography) grid of the first
+    octree level and cut into the images of every section, so no model is recomputed. 'topography'
+    gives the contacts of the geological map.
 
+    Returns, per section name, the lines and colors of each group.
+    """
+    grid: Grid = gempy_model.grid
+    outputs_centers = gempy_model.solutions.octrees_output[0].outputs_centers
+
+    contact_lines = {name: ([], []) for name in section_names}
+    for e, levels, colors in _contact_levels(gempy_model, contour_colors):
+        group_output = outputs_centers[e]
+        scalar_field = group_output.scalar_fields.exported_fields.scalar_field
+        for section_name in section_names:
+            image, extent = section_scalar_field_image(grid, group_output.grid, scalar_field, section_name)
+            lines_per_level = image_contour_lines(image, levels, extent)
+
+            segments_per_group, colors_per_group = contact_lines[section_name]
+            segments_per_group.append([line for lines in lines_per_level for line in lines])
+            colors_per_group.append([color for lines, color in zip(lines_per_level, colors) for _ in lines])
+
+    return contact_lines
+
+
+def _contact_levels(gempy_model: GeoModel, contour_colors: Optional[list[str]] = None):
+    """Index, sorted contact levels and their colors of each scalar field group."""
+    c_id = 0  # * color id startpoint
+    all_colors = contour_colors if contour_colors is not None else gempy_model.structural_frame.elements_colors_contacts
+
+    for e, scalar_field_at_surface_points in enumerate(gempy_model.solutions.raw_arrays.scalar_field_at_surface_points):
+        level = scalar_field_at_surface_points[np.where(scalar_field_at_surface_points != 0)]
+        c_id2 = c_id + len(level)
+        yield e, np.sort(level), all_colors[c_id:c_id2][::-1]
         c_id = c_id2
 
 
-def plot_section_contacts(ax, extent_val, section_name, zorder):
-    
-    # ! TODO: Update this function to use the new solutions
-    if section_name == 'topography':
-        shape = self.model._grid.topography.resolution
-
-        scalar_fields = self.model.solutions.geological_map[1:]
-        c_id = 0  # color id startpoint
-
-        for e, block in enumerate(scalar_fields):
-            level = self.model.solutions.scalar_field_at_surface_points[e][np.where(
-                self.model.solutions.scalar_field_at_surface_points[e] != 0)]
-
-            c_id2 = c_id + len(level)  # color id endpoint
-            ax.contour(
-                block.reshape(shape).T, 0,
-                levels=np.sort(level),
-                colors=self.cmap.colors[c_id:c_id2][::-1],
-                linestyles='solid',
-                origin='lower',
-                extent=extent_val,
-                zorder=zorder - (e + len(level))
-            )
-            c_id = c_id2
-
-    else:
-        l0, l1 = self.model._grid.sections.get_section_args(section_name)
-        shape = self.model._grid.sections.df.loc[section_name, 'resolution']
-        scalar_fields = self.model.solutions.sections[1:][:, l0:l1]
-
-        c_id = 0  # color id startpoint
-
-        for e, block in enumerate(scalar_fields):
-            level = self.model.solutions.scalar_field_at_surface_points[e][np.where(
-                self.model.solutions.scalar_field_at_surface_points[e] != 0)]
-
-            # Ignore warning about some scalars not being on the plot since it is very common
-            # that an interface does not exit for a given section
-            c_id2 = c_id + len(level)  # color id endpoint
-            color_list = self.model._surfaces.df.groupby('isActive').get_group(True)['color'][c_id:c_id2][::-1]
-
-            ax.contour(block.reshape(shape).T, 0, levels=np.sort(level),
-                       # colors=self.cmap.colors[self.model.surfaces.df['isActive']][c_id:c_id2],
-                       colors=color_list,
-                       linestyles='solid', origin='lower',
-                       extent=extent_val, zorder=zorder - (e + len(level))
-                       )
-            c_id = c_id2
+def _add_contacts_collection(ax, segments_per_group: list, colors_per_group: list, zorder: int, line_kwargs: dict):
+    # * One collection for all the groups. The first groups go last so they are drawn on top
+    line_collection = LineCollection(
+        [segment for segments in segments_per_group[::-1] for segment in segments],
+        colors=[color for colors in colors_per_group[::-1] for color in colors],
+        linestyles='solid',
+        zorder=zorder - 1,
+        **line_kwargs
+    )
+    ax.add_collection(line_collection, autolim=False)
+    return line_collection
+
+
+def _image_contact_lines(image: np.ndarray, levels: np.ndarray, extent: tuple, slice_cache: LRUCache = None):
+    if slice_cache is None:
+        return image_contour_lines(image, levels, extent)
+
+    key = ('contact_lines', id(image), tuple(levels.tolist()), extent)
+    # * The entry keeps the image alive so its id cannot be reused
+    return slice_cache.get_or_create(key, lambda: (image, image_contour_lines(image, levels, extent)))[1]
@@ -4,6 +4,7 @@ import warnings
 import numpy as np
 from matplotlib import pyplot as plt
 
+from gempy_viewer.core.input_data_arrays import InputDataArrays
 from gempy_viewer.core.slicer_data import SlicerData
 from gempy.core.data.grid_modules import RegularGrid, Sections
 from gempy.core.data.grid_modules import Topography
@@ -14,20 +15,18 @@ from gempy.core.data.grid import Grid
 
 
 # TODO: This could be public and the slice just a class yes!
-def draw_data(ax, surface_points_colors: list[str], orientations_colors: list[str],
-              orientations: 'pd.DataFrame', points: 'pd.DataFrame', slicer_data: SlicerData,
+def draw_data(ax, surface_points_colors: list[str], orientations_colors: list[str], slicer_data: SlicerData,
               kwargs_surface_points: dict = None,
               kwargs_orientations: dict = None):
     
     kwargs_surface_points = kwargs_surface_points if kwargs_surface_points is not None else {}
     kwargs_orientations = kwargs_orientations if kwargs_orientations is not None else {}
     
-    _draw_surface_points(ax, points, slicer_data, surface_points_colors, **kwargs_surface_points)
-    _draw_orientations(ax, orientations, orientations_colors, slicer_data, **kwargs_orientations)
+    _draw_surface_points(ax, slicer_data, surface_points_colors, **kwargs_surface_points)
+    _draw_orientations(ax, orientations_colors, slicer_data, **kwargs_orientations)
 
 
-def _draw_orientations(ax, orientations, orientations_colors, slicer_data, **kwargs):
-    sel_ori = orientations[slicer_data.select_projected_o]
+def _draw_orientations(ax, orientations_colors, slicer_data, **kwargs):
     aspect = np.subtract(*ax.get_ylim()) / np.subtract(*ax.get_xlim())
     min_axis = 'width' if aspect < 1 else 'height'
     
@@ -45,17 +44,15 @@ def _draw_orientations(ax, orientations, orientations_colors, slicer_data, **kwa
     default_kwargs.update(kwargs)
     
     ax.quiver(
-        sel_ori[slicer_data.x],
-        sel_ori[slicer_data.y],
-        sel_ori[slicer_data.Gx],
-        sel_ori[slicer_data.Gy],
+        slicer_data.orientations_xy[:, 0],
+        slicer_data.orientations_xy[:, 1],
+        slicer_data.orientations_gxy[:, 0],
+        slicer_data.orientations_gxy[:, 1],
         **default_kwargs
     )
 
 
-def _draw_surface_points(ax, points, slicer_data, surface_points_colors, **kwargs):
-    points_df = points[slicer_data.select_projected_p]
-    
+def _draw_surface_points(ax, slicer_data, surface_points_colors, **kwargs):
     # Default values that can be overridden by kwargs
     default_kwargs = {
         'c': np.array(surface_points_colors)[slicer_data.select_projected_p],
@@ -66,48 +63,41 @@ def _draw_surface_points(ax, points, slicer_data, surface_points_colors, **kwarg
     default_kwargs.update(kwargs)
     
     ax.scatter(
-        points_df[slicer_data.x],
-        points_df[slicer_data.y],
+        slicer_data.points_xy[:, 0],
+        slicer_data.points_xy[:, 1],
         **default_kwargs
     )
 
 
-def _projection_params_regular_grid(regular_grid: RegularGrid, cell_number, direction, orientations, points,
+def _projection_params_regular_grid(regular_grid: RegularGrid, cell_number, direction, input_arrays: InputDataArrays,
                                     projection_distance) -> SlicerData:
     if direction == 'x' or direction == 'X':
-        arg_ = 0
-        dx = regular_grid.dx
-        dir = 'X'
+        axis = 0
     elif direction == 'y' or direction == 'Y':
-        arg_ = 2
-        dx = regular_grid.dy
-        dir = 'Y'
+        axis = 1
     elif direction == 'z' or direction == 'Z':
-        arg_ = 4
-        dx = regular_grid.dz
-        dir = 'Z'
+        axis = 2
     else:
         raise AttributeError('Direction must be x, y, z')
 
-    _loc = regular_grid.extent[arg_] + dx * int(regular_grid.resolution[0] / 2)
-    cartesian_point_dist = points[dir] - _loc
-    cartesian_ori_dist = orientations[dir] - _loc
+    # * Center of the cells of the plotted slice
+    cell_number = int(regular_grid.resolution[axis] / 2) if cell_number == 'mid' else cell_number
+    _loc = (regular_grid.x_coord, regular_grid.y_coord, regular_grid.z_coord)[axis][cell_number]
+    select_projected_p, select_projected_o = input_arrays.select_in_slab(axis, _loc, projection_distance)
 
     _a, _b, _c, _, x, y, Gx, Gy = slice_cross_section(
         regular_grid=regular_grid,
         direction=direction,
         cell_number=cell_number
     )
-    select_projected_p = cartesian_point_dist < projection_distance
-    select_projected_o = cartesian_ori_dist < projection_distance
-    
-    slice_data = SlicerData(
+    slice_data = _slicer_data(
         x=x,
         y=y,
         Gx=Gx,
         Gy=Gy,
         select_projected_p=select_projected_p,
         select_projected_o=select_projected_o,
+        input_arrays=input_arrays,
         regular_grid_x_idx=_a,
         regular_grid_y_idx=_b,
         regular_grid_z_idx=_c
@@ -116,68 +106,67 @@ def _projection_params_regular_grid(regular_grid: RegularGrid, cell_number, dire
     return slice_data
 
 
-def _projection_params_section(grid: Grid, orientations: 'pd.DataFrame', points: 'pd.DataFrame',
+def _projection_params_section(grid: Grid, input_arrays: InputDataArrays,
                                projection_distance: float, section_name: str) -> SlicerData:
     if section_name == 'topography':
-        Gx, Gy, cartesian_ori_dist, cartesian_point_dist, x, y = _projection_params_topography(
+        select_projected_p, select_projected_o = _projection_params_topography(
             topography=grid.topography,
-            orientations=orientations,
-            points=points,
+            input_arrays=input_arrays,
             projection_distance=projection_distance,
         )
-    else:
-        # Project points:
-        sections: Sections = grid.sections
-        shift = np.asarray(sections.df.loc[section_name, 'start'])
-        end_point = np.atleast_2d(np.asarray(sections.df.loc[section_name, 'stop']) - shift)
-        A_rotate = np.dot(end_point.T, end_point) / sections.df.loc[section_name, 'dist'] ** 2
-
-        points_x_y = points[['X', 'Y']]
-        orientations_x_y = orientations[['X', 'Y']]
-    
-        perpe_sqdist = ((np.dot(A_rotate, (points_x_y).T).T - points_x_y) ** 2).sum(axis=1)
-        cartesian_point_dist = np.sqrt(perpe_sqdist)
-        perpe_sqdist = ((np.dot(A_rotate, (orientations_x_y).T).T - orientations_x_y) ** 2).sum(axis=1)
-        cartesian_ori_dist = np.sqrt(perpe_sqdist)
+        return _slicer_data('X', 'Y', 'G_x', 'G_y', select_projected_p, select_projected_o, input_arrays)
+
+    # Project points:
+    sections: Sections = grid.sections
+    start = np.asarray(sections.df.loc[section_name, 'start'], dtype=float)
+    stop = np.asarray(sections.df.loc[section_name, 'stop'], dtype=float)
+    select_projected_p, select_projected_o = input_arrays.select_near_segment(start, stop, projection_distance)
+
+    # Since we plot only the section we want the distance along it of the data projected on it
+    direction = (stop - start) / np.linalg.norm(stop - start)
+    points_x = (input_arrays.points_xyz[select_projected_p, :2] - start) @ direction
+    orientations_x = (input_arrays.orientations_xyz[select_projected_o, :2] - start) @ direction
+
+    return _slicer_data(
+        'X', 'Z', 'G_x', 'G_z', select_projected_p, select_projected_o, input_arrays,
+        points_x=points_x,
+        orientations_x=orientations_x
+    )
 
-        # These are the coordinates of the data projected on the section
-        cartesian_point = np.dot(A_rotate, (points_x_y - shift).T).T
-        cartesian_ori = np.dot(A_rotate, (orientations_x_y - shift).T).T
 
-        # Since we plot only the section we want the norm of those coordinates
-        points['X'] = np.linalg.norm(cartesian_point, axis=1)
-        orientations['X'] = np.linalg.norm(cartesian_ori, axis=1)
-        x, y, Gx, Gy = 'X', 'Z', 'G_x', 'G_z'
+_AXES = {'X': 0, 'Y': 1, 'Z': 2, 'G_x': 0, 'G_y': 1, 'G_z': 2}
 
-    select_projected_p = cartesian_point_dist < projection_distance
-    select_projected_o = cartesian_ori_dist < projection_distance
 
-    slicer_data = SlicerData(
+def _slicer_data(x, y, Gx, Gy, select_projected_p, select_projected_o, input_arrays: InputDataArrays,
+                 points_x=None, orientations_x=None, **regular_grid_idx) -> SlicerData:
+    """Slicer data with the plot coordinates of the selected input data as new arrays.
+
+    ``points_x`` and ``orientations_x`` replace the horizontal coordinate, e.g. by the distance
+    along a section.
+    """
+    points_xy = input_arrays.points_xyz[select_projected_p][:, [_AXES[x], _AXES[y]]]
+    orientations_xy = input_arrays.orientations_xyz[select_projected_o][:, [_AXES[x], _AXES[y]]]
+    if points_x is not None:
+        points_xy[:, 0] = points_x
+    if orientations_x is not None:
+        orientations_xy[:, 0] = orientations_x
+
+    return SlicerData(
         x=x,
         y=y,
         Gx=Gx,
         Gy=Gy,
         select_projected_p=select_projected_p,
-        select_projected_o=select_projected_o
+        select_projected_o=select_projected_o,
+        points_xy=points_xy,
+        orientations_xy=orientations_xy,
+        orientations_gxy=input_arrays.orientations_gradients[select_projected_o][:, [_AXES[Gx], _AXES[Gy]]],
+        **regular_grid_idx
     )
 
-    return slicer_data
 
-
-def _projection_params_topography(topography: Topography, orientations, points, projection_distance, topography_compression: int = 5000):
-    from gempy_viewer.optional_dependencies import require_scipy
-    scipy = require_scipy()
-    dd = scipy.spatial.distance
+def _projection_params_topography(topography: Topography, input_arrays: InputDataArrays, projection_distance,
+                                  topography_compression: int = 5000):
     decimation_aux = int(topography.values.shape[0] / topography_compression)
     tpp = topography.values[::decimation_aux + 1, :]
-    cdist_sp = dd.cdist(
-        XA=tpp,
-        XB=points[['X', 'Y', 'Z']])
-    cartesian_point_dist = (cdist_sp < projection_distance).sum(axis=0).astype(bool)
-    cdist_ori = dd.cdist(
-        XA=tpp,
-        XB=orientations[['X', 'Y', 'Z']]
-    )
-    cartesian_ori_dist = (cdist_ori < projection_distance).sum(axis=0).astype(bool)
-    x, y, Gx, Gy = 'X', 'Y', 'G_x', 'G_y'
-    return Gx, Gy, cartesian_ori_dist, cartesian_point_dist, x, y
+    return input_arrays.select_near_surface(tpp, projection_distance)
@@ -3,22 +3,21 @@ import numpy as np
 
 from gempy.core.data import GeoModel, Grid
 from gempy_engine.core.data.raw_arrays_solution import RawArraysSolution
+from gempy_viewer.core.lru_cache import LRUCache
 from gempy_viewer.core.slicer_data import SlicerData
+from gempy_viewer.modules.plot_2d.plot_2d_utils import regular_grid_slice
 
 
 # TODO: This name seems bad. This is plotting area basically?
 def plot_regular_grid_area(ax, slicer_data: SlicerData, block: np.ndarray, resolution: iter,
-                           cmap: mcolors.Colormap, norm: mcolors.Normalize, imshow_kwargs: dict = None):
+                           cmap: mcolors.Colormap, norm: mcolors.Normalize, imshow_kwargs: dict = None,
+                           slice_cache: LRUCache = None):
     if imshow_kwargs is None:
         imshow_kwargs = dict()
 
     plot_grid = imshow_kwargs.pop('plot_grid', False)
 
-    plot_block = block.reshape(resolution)
-    image = plot_block[
-        slicer_data.regular_grid_x_idx,
-        slicer_data.regular_grid_y_idx,
-        slicer_data.regular_grid_z_idx].T
+    image = regular_grid_slice(block, resolution, slicer_data, slice_cache)
 
     im = ax.imshow(
         image,
@@ -1,90 +1,84 @@
 ﻿import numpy as np
+from matplotlib.contour import ContourSet
 
+from gempy_viewer.core.contour_lines import contour_overlay
+from gempy_viewer.core.lru_cache import LRUCache
 from gempy_viewer.core.slicer_data import SlicerData
 from gempy.core.data import GeoModel, Grid
-from gempy_engine.core.data.raw_arrays_solution import RawArraysSolution
+from gempy_viewer.modules.plot_2d.plot_2d_utils import regular_grid_slice, section_scalar_field_image
 from gempy_viewer.modules.plot_2d.visualization_2d import Plot2D
 
 
-def plot_regular_grid_scalar_field(ax, slicer_data: SlicerData, block: np.ndarray, resolution: iter, kwargs: dict):
-    extent_val = [*ax.get_xlim(), *ax.get_ylim()]
+def plot_regular_grid_scalar_field(ax, slicer_data: SlicerData, block: np.ndarray, resolution: iter, kwargs: dict,
+                                   slice_cache: LRUCache = None):
+    image = regular_grid_slice(block, resolution, slicer_data, slice_cache)
+    _plot_scalar_field_overlay(ax, image, kwargs, slice_cache)
+    return ax
 
-    plot_block = block.reshape(resolution)
-    image = plot_block[
-        slicer_data.regular_grid_x_idx,
-        slicer_data.regular_grid_y_idx,
-        slicer_data.regular_grid_z_idx
-    ].T
 
+def plot_section_scalar_field(gempy_model: GeoModel, ax, section_name=None, series_n: int = 0, kwargs: dict = None,
+                              slice_cache: LRUCache = None):
+    image = _section_image(gempy_model, section_name, series_n, slice_cache)
+    _plot_scalar_field_overlay(ax, image, kwargs if kwargs is not None else {}, slice_cache)
+    return ax
 
-    ax.contour(
-        image,
-        cmap='autumn',
-        extent=extent_val,
-        zorder=8,
-        **kwargs
-    )
-    if 'N' in kwargs:
-        kwargs.pop('N')
-    ax.contourf(
-        image,
-        cmap='autumn',
-        extent=extent_val,
-        zorder=7,
-        alpha=.8,
-        **kwargs
-    )
 
-    return ax
+def _plot_scalar_field_overlay(ax, image: np.ndarray, kwargs: dict, slice_cache: LRUCache = None):
+    """Isolines and filled bands of the scalar field, both built from one contour generator.
 
+    ``levels`` (or the legacy ``N``) in ``kwargs`` set the levels of both overlays, the rest of ``kwargs``
+    goes to both :class:`ContourSet`.
+    """
+    kwargs = dict(kwargs)
+    levels = kwargs.pop('levels', kwargs.pop('N', None))
+    extent_val = (*ax.get_xlim(), *ax.get_ylim())
 
-def plot_section_scalar_field(gempy_model: GeoModel, ax, section_name=None, series_n: int = 0, **kwargs):
-    extent_val = [*ax.get_xlim(), *ax.get_ylim()]
+    levels, lines, polygons, codes = _image_overlay(image, extent_val, levels, slice_cache)
+    if any(len(level_lines) for level_lines in lines):
+        ContourSet(ax, levels, lines, cmap='autumn', zorder=8, **kwargs)
+    if any(len(band_polygons) for band_polygons in polygons):
+        ContourSet(ax, levels, polygons, codes, filled=True, cmap='autumn', zorder=7, alpha=.8, **kwargs)
 
-    image = _prepare_section_image(gempy_model, section_name, series_n=series_n)
 
-    ax.contour(
-        image,
-        cmap='autumn',
-        extent=extent_val,
-        zorder=8,
-        **kwargs
-    )
-    if 'N' in kwargs:
-        kwargs.pop('N')
-    ax.contourf(
-        image,
-        cmap='autumn',
-        extent=extent_val,
-        zorder=7,
-        alpha=.8,
-        **kwargs
-    )
+def _image_overlay(image: np.ndarray, extent: tuple, levels, slice_cache: LRUCache = None):
+    if slice_cache is None:
+        return contour_overlay(image, extent, levels)
+
+    levels_key = levels if levels is None or np.isscalar(levels) else tuple(np.asarray(levels, dtype=float).tolist())
+    key = ('scalar_field_overlay', id(image), levels_key, extent)
+    # * The entry keeps the image alive so its id cannot be reused
+    return slice_cache.get_or_create(key, lambda: (image, contour_overlay(image, extent, levels)))[1]
 
-    return ax
+
+def _section_image(gempy_model: GeoModel, section_name: str, series_n: int = 0, slice_cache: LRUCache = None):
+    if slice_cache is None:
+        return _prepare_section_image(gempy_model, section_name, series_n=series_n)
+
+    solutions = gempy_model.solutions
+    key = ('section_scalar_field', id(solutions), section_name, int(series_n))
+    return slice_cache.get_or_create(
+        key,
+        lambda: (solutions, np.ascontiguousarray(_prepare_section_image(gempy_model, section_name, series_n=series_n), dtype=np.float32))
+    )[1]
 
 
 def _prepare_section_image(gempy_model: GeoModel, section_name: str, series_n: int = 0):
-    legacy_solutions: RawArraysSolution = gempy_model.solutions.raw_arrays
     grid: Grid = gempy_model.grid
 
     if section_name == 'topography':
-        try:
-            image = legacy_solutions.geological_map[1][series_n].reshape(grid.topography.values_2d[:, :, 2].shape).T
-        except AttributeError:
+        if grid.topography is None:
             raise AttributeError('Geological map not computed. Activate the topography grid.')
     else:
         assert type(section_name) == str or type(
             section_name) == np.str_, 'section name must be a string of the name of the section'
-        assert legacy_solutions.sections is not None, 'no sections for plotting defined'
-
-        l0, l1 = grid.sections.get_section_args(section_name)
-        shape = grid.sections.df.loc[section_name, 'resolution']
-        
-        first_level_octree = gempy_model.solutions.octrees_output[0]
-        group_output = first_level_octree.outputs_centers[series_n]
-        scalar_field_ALL_sections = group_output.scalar_fields.exported_fields.scalar_field[group_output.grid.sections_slice]
-        scalar_field_THIS_section = scalar_field_ALL_sections[l0:l1]
-        image = scalar_field_THIS_section.reshape(shape[0], shape[1]).T
-        # image = legacy_solutions.sections[1][l0:l1].reshape(shape[0], shape[1]).T
+        assert grid.sections is not None, 'no sections for plotting defined'
+
+    first_level_octree = gempy_model.solutions.octrees_output[0]
+    group_output = first_level_octree.outputs_centers[series_n]
+    image, _ = section_scalar_field_image(
+        grid=grid,
+        solution_grid=group_output.grid,
+        scalar_field=group_output.scalar_fields.exported_fields.scalar_field,
+        section_name=section_name
+    )
     return image
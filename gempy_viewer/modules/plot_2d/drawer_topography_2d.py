@@ -1,12 +1,16 @@
 ﻿import warnings
 
 import numpy as np
+from matplotlib.contour import ContourSet
 
 from gempy.core.data import GeoModel, Grid
 
 from gempy.core.data.grid_modules import Sections, RegularGrid
-from gempy_viewer.modules.plot_2d.plot_2d_utils import check_default_section, slice_topo_4_sections, calculate_p1p2
-from gempy_viewer.optional_dependencies import require_skimage
+from gempy_viewer.core.section_data_2d import SectionData2D, SectionType
+from gempy_viewer.core.topography_contours import get_topography_contours
+from gempy_viewer.core.topography_raster import axes_pixel_shape, topography_heights, topography_hillshade
+from gempy_viewer.modules.plot_2d.plot_2d_utils import check_default_section, slice_topo_4_sections, calculate_p1p2, \
+    topography_profiles
 
 
 def plot_topography(
@@ -18,7 +22,13 @@ def plot_topography(
         cell_number=None,
         direction='y',
         block=None,
+        profile=None,
         **kwargs):
+    """Plot the topography on top-down maps or as a mask over cross sections.
+
+    ``profile`` is the (x, y, z) topography along the section if it was already extracted, e.g. for
+    all sections at once with :func:`section_topography_profiles`.
+    """
     # Check topography in model 
     if gempy_model.grid.topography is None:
         raise ValueError('Cannot plot topography, no topography in model')
@@ -34,35 +44,65 @@ def plot_topography(
     regular_grid: RegularGrid = grid.regular_grid
 
     if section_name is not None and section_name != 'topography':
-        _plot_mask_on_vertical_cross_section(ax, grid, regular_grid, section_name)
+        _plot_mask_on_vertical_cross_section(ax, grid, regular_grid, section_name, profile)
     elif section_name == 'topography':
-        _plot_top_down_topography(altdeg, ax, azdeg, cmap, contour, fill_contour, grid, hillshade)
+        _plot_top_down_topography(
+            altdeg, ax, azdeg, cmap, contour, fill_contour, grid, hillshade,
+            contour_levels=kwargs.get('contour_levels', None),
+            contour_interval=kwargs.get('contour_interval', None),
+            supersample=kwargs.get('supersample', True)
+        )
     elif cell_number is not None or block is not None:
-        _plot_mask_on_orthogonal_cross_section(ax, cell_number, direction, grid, regular_grid)
+        _plot_mask_on_orthogonal_cross_section(ax, cell_number, direction, grid, regular_grid, profile)
     return ax
 
 
-def _plot_top_down_topography(altdeg, ax, azdeg, cmap, height_contours, fill_contour, grid, hillshade):
-    skimage = require_skimage()
+def section_topography_profiles(grid: Grid, sections_data: list[SectionData2D]) -> dict:
+    """Topography along every cross section of the figure, extracted with a single DEM interpolator.
+
+    Named sections are keyed by their name and orthogonal ones by (direction, cell_number).
+    """
+    traces = {}
+    for section_data in sections_data:
+        match section_data.section_type:
+            case SectionType.SECTION if section_data.section_name != 'topography':
+                sections_df = grid.sections.df
+                traces[section_data.section_name] = (
+                    sections_df.loc[section_data.section_name, 'start'],
+                    sections_df.loc[section_data.section_name, 'stop'],
+                    grid.topography.resolution[0]
+                )
+            case SectionType.ORTHOGONAL if section_data.direction in ('x', 'y'):
+                p1, p2 = calculate_p1p2(grid.regular_grid, section_data.direction, section_data.cell_number)
+                traces[(section_data.direction, section_data.cell_number)] = (p1, p2, grid.regular_grid.resolution[0])
+
+    try:
+        return topography_profiles(grid, traces)
+    except IndexError:
+        return {}  # * Topography is not a raster, every section falls back to its own extraction
+
+
+def _plot_top_down_topography(altdeg, ax, azdeg, cmap, height_contours, fill_contour, grid, hillshade,
+                              contour_levels=None, contour_interval=None, supersample=True):
     from gempy_viewer.modules.plot_2d.helpers import add_colorbar
     topo = grid.topography
-    topo_super_res = skimage.transform.resize(
-        topo.values_2d,
-        (1600, 1600),
-        order=3,
-        mode='edge',
-        anti_aliasing=True, preserve_range=False)
-    values = topo_super_res[:, :, 2].T
+    # * Heights resampled to the pixels of the axes only when the DEM is coarser than them
+    target_shape = axes_pixel_shape(ax) if supersample is True else None
+    values = topography_heights(topo, target_shape)
 
     if height_contours is True:
-        CS = ax.contour(
-            values,
-            extent=(topo.extent[:4]),
-            colors='k',
-            linestyles='solid',
-            origin='lower'
-        )
-        ax.clabel(CS, inline=1, fontsize=10, fmt='%d')
+        # * Isolines shared with the 3D topography through the contour cache
+        levels, lines = get_topography_contours(topo, levels=contour_levels, interval=contour_interval)
+        # * A flat DEM, or levels outside of its heights, give no isolines
+        if any(len(lines_of_level) for lines_of_level in lines):
+            CS = ContourSet(
+                ax,
+                levels,
+                lines,
+                colors='k',
+                linestyles='solid'
+            )
+            ax.clabel(CS, inline=1, fontsize=10, fmt='%d')
 
     if fill_contour is True:
         CS2 = ax.contourf(
@@ -73,14 +113,9 @@ def _plot_top_down_topography(altdeg, ax, azdeg, cmap, height_contours, fill_con
         add_colorbar(axes=ax, label='elevation [m]', cs=CS2)
 
     if hillshade is True:
-        from matplotlib.colors import LightSource
-
-        ls = LightSource(
-            azdeg=azdeg,
-            altdeg=altdeg
-        )
+        # * Shared by every axes and plot_2d call showing the same topography and light
         ax.imshow(
-            ls.hillshade(values),
+            topography_hillshade(topo, azdeg=azdeg, altdeg=altdeg, target_shape=target_shape),
             origin='lower',
             extent=topo.extent[:4],
             alpha=0.5,
@@ -89,7 +124,7 @@ def _plot_top_down_topography(altdeg, ax, azdeg, cmap, height_contours, fill_con
         )
 
 
-def _plot_mask_on_orthogonal_cross_section(ax, cell_number, direction, grid, regular_grid):
+def _plot_mask_on_orthogonal_cross_section(ax, cell_number, direction, grid, regular_grid, profile=None):
     p1, p2 = calculate_p1p2(
         regular_grid=regular_grid,
         direction=direction,
@@ -98,7 +133,7 @@ def _plot_mask_on_orthogonal_cross_section(ax, cell_number, direction, grid, reg
     resx = regular_grid.resolution[0]
     resy = regular_grid.resolution[1]
     try:
-        x, y, z = slice_topo_4_sections(
+        x, y, z = profile if profile is not None else slice_topo_4_sections(
             grid=grid,
             p1=p1,
             p2=p2,
@@ -124,11 +159,11 @@ def _plot_mask_on_orthogonal_cross_section(ax, cell_number, direction, grid, reg
         warnings.warn('Topography needs to be a raster to be able to plot it')
 
 
-def _plot_mask_on_vertical_cross_section(ax, grid, regular_grid, section_name):
+def _plot_mask_on_vertical_cross_section(ax, grid, regular_grid, section_name, profile=None):
     sections: Sections = grid.sections
     p1 = sections.df.loc[section_name, 'start']
     p2 = sections.df.loc[section_name, 'stop']
-    x, y, z = slice_topo_4_sections(
+    x, y, z = profile if profile is not None else slice_topo_4_sections(
         grid=grid,
         p1=p1,
         p2=p2,
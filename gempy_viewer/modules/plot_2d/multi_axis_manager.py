@@ -2,8 +2,10 @@
 
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.gridspec import GridSpec
 from matplotlib.ticker import FixedLocator, FixedFormatter
 
+from gempy_viewer.core.input_data_arrays import InputDataArrays
 from gempy_viewer.core.slicer_data import SlicerData
 from gempy_viewer.core.section_data_2d import SectionData2D, SectionType
 from gempy.core.data import Grid, GeoModel
@@ -13,29 +15,38 @@ from gempy_viewer.modules.plot_2d.plot_2d_utils import make_section_xylabels, sl
 from gempy_viewer.modules.plot_2d.drawer_input_2d import _projection_params_section, _projection_params_regular_grid
 
 
+def create_panel_grid(plot_2d: Plot2D, n_axis: int, n_columns: int) -> GridSpec:
+    """GridSpec of the figure with ``n_columns`` and as many rows as needed for ``n_axis`` panels.
+
+    The panels take its cells row by row, so there is no limit on their number. The layout is not
+    computed here but once, after all the axes are added.
+    """
+    n_columns = max(int(n_columns), 1)
+    n_rows = max(int(np.ceil(n_axis / n_columns)), 1)
+    return plot_2d.fig.add_gridspec(nrows=n_rows, ncols=n_columns)
+
+
 def sections_iterator(plot_2d: Plot2D, gempy_model: GeoModel, sections_names: list[str],
-                      n_axis: int, n_columns: int, ve: float, projection_distance: Optional[float] = None,
-                      e:int =0) -> list[SectionData2D]:
+                      grid_spec: GridSpec, ve: float, projection_distance: Optional[float] = None,
+                      input_arrays: Optional[InputDataArrays] = None) -> list[SectionData2D]:
     section_data_list: list[SectionData2D] = []
+    input_arrays = input_arrays if input_arrays is not None else InputDataArrays.from_geo_model(gempy_model)
     for e, sec_name in enumerate(sections_names):
         # region matplotlib configuration
         # Check if a plot that fills all pixels is plotted
         _is_filled = False
-        assert e < 10, 'Reached maximum of axes'
 
-        ax_pos = (round(n_axis / 2 + 0.1)) * 100 + n_columns + e + 1
         temp_ax = create_ax_section(
             plot_2d=plot_2d,
             gempy_grid=gempy_model.grid,
             section_name=sec_name,
-            ax_pos=ax_pos,
+            ax_pos=grid_spec[e],
             ve=ve
         )
         # endregion 
         slicer_data: SlicerData = _projection_params_section(
             grid=gempy_model.grid,
-            orientations=gempy_model.orientations_copy.df.copy(),
-            points=gempy_model.surface_points_copy.df.copy(),
+            input_arrays=input_arrays,
             projection_distance=projection_distance,
             section_name=sec_name
         )
@@ -55,29 +66,28 @@ def sections_iterator(plot_2d: Plot2D, gempy_model: GeoModel, sections_names: li
 
 
 def orthogonal_sections_iterator(initial_axis: int, plot_2d: Plot2D, gempy_model: GeoModel, direction: list[str], cell_number: list[int],
-                                 n_axis: int, n_columns: int, ve: float, projection_distance: Optional[float] = None) -> list[SectionData2D]:
+                                 grid_spec: GridSpec, ve: float, projection_distance: Optional[float] = None,
+                                 input_arrays: Optional[InputDataArrays] = None) -> list[SectionData2D]:
     section_data_list: list[SectionData2D] = []
+    input_arrays = input_arrays if input_arrays is not None else InputDataArrays.from_geo_model(gempy_model)
     for e in range(len(cell_number)):
         # region matplotlib configuration
         # Check if a plot that fills all pixels is plotted
         _is_filled = False
-        assert e < 10, 'Reached maximum of axes'
 
-        ax_pos = (round(n_axis / 2 + 0.1)) * 100 + n_columns + e + 1 + initial_axis
         temp_ax = create_axes_orthogonal(
             plot_2d=plot_2d,
             gempy_grid=gempy_model.grid,
             cell_number=cell_number[e],
             direction=direction[e],
-            ax_pos=ax_pos,
+            ax_pos=grid_spec[e + initial_axis],
             ve=ve
         )
         
         # endregion 
         slicer_data: SlicerData = _projection_params_regular_grid(
             regular_grid=gempy_model.grid.regular_grid,
-            orientations=gempy_model.orientations_copy.df.copy(),
-            points=gempy_model.surface_points_copy.df.copy(),
+            input_arrays=input_arrays,
             projection_distance=projection_distance,
             cell_number=cell_number[e],
             direction=direction[e]
@@ -131,7 +141,6 @@ def create_ax_section(plot_2d: Plot2D, gempy_grid: Grid, section_name, ax=None,
     ax.section_name = section_name
     ax.tick_params(axis='x', labelrotation=30)
     plot_2d.axes = np.append(plot_2d.axes, ax)
-    plot_2d.fig.tight_layout()
 
     return ax
 
@@ -153,9 +162,8 @@ def create_axes_orthogonal(plot_2d: Plot2D, gempy_grid: Grid, cell_number,
     ax.direction = direction
     ax.tick_params(axis='x', labelrotation=30)
 
-   
+
     plot_2d.axes = np.append(plot_2d.axes, ax)
-    plot_2d.fig.tight_layout()
 
     return ax
 
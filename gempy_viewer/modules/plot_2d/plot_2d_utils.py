@@ -1,11 +1,15 @@
-﻿from typing import Sequence
+﻿import warnings
+from typing import Hashable, Optional, Sequence
 
 import numpy as np
 import matplotlib.colors as mcolors
 
 from gempy.core.data import Grid
-from gempy.core.data.core_utils import calculate_line_coordinates_2points, interpolate_zvals_at_xy
+from gempy.core.data.core_utils import calculate_line_coordinates_2points
 from gempy.core.data.grid_modules import Sections, RegularGrid
+from gempy_viewer.core.lru_cache import LRUCache
+from gempy_viewer.core.slicer_data import SlicerData
+from gempy_viewer.optional_dependencies import require_scipy
 
 
 def slice_cross_section(regular_grid: RegularGrid, direction: str, cell_number: int or str):
@@ -37,6 +41,56 @@ def slice_cross_section(regular_grid: RegularGrid, direction: str, cell_number:
     return _a, _b, _c, extent_val, x, y, Gx, Gy
 
 
+def regular_grid_slice(block: np.ndarray, resolution: Sequence[int], slicer_data: SlicerData,
+                       slice_cache: Optional[LRUCache] = None) -> np.ndarray:
+    """
+    2D image, as a contiguous array, of ``block`` on the regular grid slice selected by ``slicer_data``
+
+    With a ``slice_cache`` the slice is extracted once per array, direction and cell and shared by
+    all the drawers and panels of the figure. Arrays are identified by their memory, so different
+    views of the same row of e.g. the scalar field matrix share the entry.
+    """
+    idx = (slicer_data.regular_grid_x_idx, slicer_data.regular_grid_y_idx, slicer_data.regular_grid_z_idx)
+
+    def _slice():
+        return np.ascontiguousarray(block.reshape(resolution)[idx].T)
+
+    if slice_cache is None:
+        return _slice()
+
+    key = (
+        block.__array_interface__['data'][0], block.shape, block.strides, block.dtype.str,
+        tuple(int(r) for r in resolution), tuple(_hashable_index(i) for i in idx)
+    )
+    # * The entry keeps the array alive so its memory cannot be reused by another array with the same key
+    return slice_cache.get_or_create(key, lambda: (block, _slice()))[1]
+
+
+def section_scalar_field_image(grid: Grid, solution_grid, scalar_field: np.ndarray,
+                               section_name: str) -> tuple[np.ndarray, tuple]:
+    """
+    Image and extent of a scalar field of the solution on a custom section or, with 'topography', on the
+    geological map
+
+    ``solution_grid`` is the grid of the octree level the scalar field was computed on, which locates
+    the sections and the topography in it.
+    """
+    if section_name == 'topography':
+        shape = grid.topography.values_2d[:, :, 2].shape
+        image = scalar_field[solution_grid.topography_slice].reshape(shape).T
+        return image, tuple(grid.topography.extent[:4])
+
+    l0, l1 = grid.sections.get_section_args(section_name)
+    shape = grid.sections.df.loc[section_name, 'resolution']
+    image = scalar_field[solution_grid.sections_slice][l0:l1].reshape(shape[0], shape[1]).T
+    extent = (0, grid.sections.df.loc[section_name, 'dist'], grid.regular_grid.extent[4], grid.regular_grid.extent[5])
+    return image, extent
+
+
+def _hashable_index(index):
+    return (index.start, index.stop, index.step) if isinstance(index, slice) else int(index)
+
+
 def make_section_xylabels(sections: Sections, section_name, n=5):
     """
     @elisa heim
@@ -87,7 +141,7 @@ def check_default_section(ax, section_name, cell_number, direction):
     return section_name, cell_number, direction
 
 
-def slice_topo_4_sections(grid: Grid, p1, p2, resx, method='interp2d'):
+def slice_topo_4_sections(grid: Grid, p1, p2, resx, method=None):
     """
     Slices topography along a set linear section
 
@@ -95,15 +149,56 @@ def slice_topo_4_sections(grid: Grid, p1, p2, resx, method='interp2d'):
         :param p1: starting point (x,y) of the section
         :param p2: end point (x,y) of the section
         :param resx: resolution of the defined section
-        :param method: interpolation method, 'interp2d' for cubic scipy.interpolate.interp2d
-                                         'spline' for scipy.interpolate.RectBivariateSpline
+        :param method: deprecated and ignored, the topography is always interpolated with
+                       scipy.interpolate.RectBivariateSpline
 
     Returns:
         :return: returns x,y,z values of the topography along the section
     """
-    xy = calculate_line_coordinates_2points(p1, p2, resx)
-    z = interpolate_zvals_at_xy(xy, grid.topography, method)
-    return xy[:, 0], xy[:, 1], z
+    if method is not None:
+        warnings.warn(
+            'method is deprecated and ignored: the topography is always interpolated with RectBivariateSpline.',
+            DeprecationWarning
+        )
+    return topography_profiles(grid, {None: (p1, p2, resx)})[None]
+
+
+def topography_profiles(grid: Grid, traces: dict[Hashable, tuple]) -> dict[Hashable, tuple]:
+    """
+    Slices topography along many linear sections at once
+
+    One spline is fitted to the DEM and evaluated at the points of all the traces in a single call,
+    instead of once per section.
+
+    Args:
+        :param traces: {key: (p1, p2, resx)} with the start point, end point and resolution of each section
+
+    Returns:
+        :return: {key: (x, y, z)} values of the topography along each section
+    """
+    scipy = require_scipy()
+    if len(traces) == 0:
+        return {}
+
+    p1 = np.array([trace[0] for trace in traces.values()], dtype=float)
+    p2 = np.array([trace[1] for trace in traces.values()], dtype=float)
+    resx = np.array([trace[2] for trace in traces.values()], dtype=int)
+
+    # * Fraction along its trace of every point, as np.linspace(0, 1, resx) for each section
+    trace_idx = np.repeat(np.arange(resx.shape[0]), resx)
+    step = np.arange(resx.sum()) - np.repeat(np.cumsum(resx) - resx, resx)
+    fraction = step / np.maximum(resx - 1, 1)[trace_idx]
+    xy = p1[trace_idx] + (p2 - p1)[trace_idx] * fraction[:, None]
+
+    values_2d = grid.topography.values_2d
+    spline = scipy.interpolate.RectBivariateSpline(values_2d[:, 0, 0], values_2d[0, :, 1], values_2d[:, :, 2])
+    z = spline.ev(xy[:, 0], xy[:, 1])
+
+    splits = np.cumsum(resx)[:-1]
+    return {
+        key: (xy_trace[:, 0], xy_trace[:, 1], z_trace)
+        for key, xy_trace, z_trace in zip(traces.keys(), np.split(xy, splits), np.split(z, splits))
+    }
 
 
 def calculate_p1p2(regular_grid: RegularGrid, direction, cell_number):
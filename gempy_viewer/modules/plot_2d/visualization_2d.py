@@ -27,6 +27,8 @@ from typing import Optional
 import matplotlib
 import matplotlib.pyplot as plt
 
+from gempy_viewer.core.lru_cache import LRUCache, _nbytes
+
 plt.style.use(['seaborn-v0_8-white', 'seaborn-v0_8-talk'])
 
 warnings.filterwarnings("ignore", message="No contour levels were found")
@@ -41,6 +43,8 @@ class Plot2D:
     def __init__(self):
         # TODO: Moving this to plotting options
         self.axes = list()
+        # * Regular grid slices shared by the drawers and panels of this figure, see regular_grid_slice
+        self.slice_cache = LRUCache(max_size=256, max_bytes=512 * 2 ** 20, size_of=_slice_nbytes)
 
     @staticmethod
     def remove(ax):
@@ -73,6 +77,11 @@ class Plot2D:
         return self.fig, self.axes  # , self.gs_0
 
 
+def _slice_nbytes(entry) -> int:
+    _, value = entry  # * Only the slice or its lines count, the sliced array is owned by the model
+    return _nbytes(value)
+
+
 def _scale_fig_size(figsize, textsize, rows=1, cols=1):
     """Scale figure properties according to rows and cols.
 
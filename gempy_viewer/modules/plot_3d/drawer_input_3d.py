@@ -5,6 +5,7 @@ from gempy.core.data.orientations import OrientationsTable
 from gempy.core.data.surface_points import SurfacePointsTable
 from matplotlib.colors import ListedColormap
 
+from gempy_viewer.core.ids_mapping import vectorize_ids
 from gempy_viewer.modules.plot_2d.plot_2d_utils import get_geo_model_cmap
 from gempy_viewer.modules.plot_3d.vista import GemPyToVista
 from gempy_viewer.optional_dependencies import require_pyvista
@@ -15,6 +16,7 @@ def plot_data(gempy_vista: GemPyToVista,
               arrows_factor: float,
               show_nugget_effect: bool,
               transformed_data: bool = False,
+              instanced_arrows: bool = False,
               **kwargs):
     if transformed_data:
         surface_points_copy = model.surface_points_copy_transformed
@@ -35,7 +37,8 @@ def plot_data(gempy_vista: GemPyToVista,
         orientations=orientations_copy,
         surface_points=surface_points_copy,
         arrows_factor=arrows_factor,
-        element_colors=model.structural_frame.elements_colors
+        element_colors=model.structural_frame.elements_colors,
+        instanced_arrows=instanced_arrows
     )
 
 
@@ -58,8 +61,8 @@ def plot_surface_points(
     ids = surface_points.ids
     if ids.shape[0] == 0:
         return
-    vectorize_ids = _vectorize_ids(ids, ids)
-    poly['id'] = vectorize_ids
+    mapped_ids = vectorize_ids(ids, ids)
+    poly['id'] = mapped_ids
 
     gempy_vista.surface_points_mesh = poly
     gempy_vista.surface_points_actor = gempy_vista.p.add_mesh(
@@ -69,7 +72,7 @@ def plot_surface_points(
         point_size=point_size,
         show_scalar_bar=False,
         cmap=(ListedColormap(element_colors)),
-        clim=(-0.5, np.unique(vectorize_ids).shape[0] + .5)
+        clim=(-0.5, np.unique(mapped_ids).shape[0] + .5)
     )
 
 
@@ -101,6 +104,7 @@ def plot_orientations(
         show_arrow_outline=True,
         outline_color='white',
         outline_width=1,
+        instanced_arrows: bool = False,  # Render the arrows as gpu instances of one glyph (vtkGlyph3DMapper)
 ):
     orientations_xyz = orientations.xyz
     orientations_grads = orientations.grads
@@ -111,41 +115,47 @@ def plot_orientations(
     pv = require_pyvista()
     poly = pv.PolyData(orientations_xyz)
 
-    vectorize_ids = _vectorize_ids(
+    mapped_ids = vectorize_ids(
         mapping_ids=surface_points.ids,
         ids_to_map=orientations.ids
     )
-    poly['id'] = vectorize_ids
+    poly['id'] = mapped_ids
     poly['vectors'] = orientations_grads
 
-    # Determine scaling mode
-    if arrow_scale_mode == 'vector':
-        # Scale arrows by their magnitude
-        arrows = poly.glyph(
-            orient='vectors',
-            scale='vectors',
-            factor=arrows_factor,
-        )
-    else:
-        # Fixed scale (original behavior)
-        arrows = poly.glyph(
-            orient='vectors',
-            scale=False,
-            factor=arrows_factor,
+    clim = (-0.5, np.unique(surface_points.ids).shape[0] + .5)
+    scale_by_vectors = arrow_scale_mode == 'vector'  # * Otherwise fixed scale (original behavior)
+
+    if instanced_arrows:
+        # * One arrow instanced on the GPU per orientation instead of a triangulated mesh of all of them
+        if show_arrow_outline:
+            outline_actor = _add_instanced_arrows(gempy_vista, poly, arrows_factor, scale_by_vectors)
+            _set_arrow_outline_properties(outline_actor, outline_color, outline_width, arrow_opacity)
+
+        gempy_vista.orientations_actor = _add_instanced_arrows(
+            gempy_vista=gempy_vista,
+            poly=poly,
+            arrows_factor=arrows_factor,
+            scale_by_vectors=scale_by_vectors,
+            cmap=ListedColormap(element_colors),
+            clim=clim
         )
+        gempy_vista.orientations_actor.prop.opacity = arrow_opacity
+        gempy_vista.orientations_actor.prop.interpolation = 'gouraud'
+        gempy_vista.orientations_mesh = poly
+        return
+
+    # * The glyphs are computed once and shared by the outline and the colored arrows
+    arrows = poly.glyph(
+        orient='vectors',
+        scale='vectors' if scale_by_vectors else False,
+        factor=arrows_factor,
+    )
 
     # Optional: Add outlined arrows for better visibility
     if show_arrow_outline:
-        # Create a slightly larger version for the outline
-        arrows_outline = poly.glyph(
-            orient='vectors',
-            scale=False if arrow_scale_mode == 'fixed' else 'vectors',
-            factor=arrows_factor 
-        )
-        
         # Add outline FIRST (behind)
         gempy_vista.p.add_mesh(
-            mesh=arrows_outline,
+            mesh=arrows,
             color=outline_color,
             style='wireframe',  # This is the key!
             line_width=outline_width,
@@ -158,30 +168,52 @@ def plot_orientations(
         scalars='id',
         show_scalar_bar=False,
         cmap=(ListedColormap(element_colors)),
-        clim=(-0.5, np.unique(surface_points.ids).shape[0] + .5),
+        clim=clim,
         opacity=arrow_opacity,
         smooth_shading=True,
     )
     gempy_vista.orientations_mesh = arrows
 
-def _vectorize_ids(mapping_ids, ids_to_map):
-    def _mapping_dict(ids):
-        unique_values, first_indices = np.unique(ids, return_index=True)  # Find the unique elements and their first indices
-        unique_values_order = unique_values[np.argsort(first_indices)]  # Sort the unique values by their first appearance in `a`
-        # Flip order to please pyvista vertical scalarbar
-        unique_values_order = unique_values_order[::-1]
-        mapping_dict = {value: i + 1 for i, value in enumerate(unique_values_order)}  # Use a dictionary to map the original numbers to new values
-        return mapping_dict
-
-    mapping_dict = _mapping_dict(mapping_ids)
-
-    # Filter out invalid IDs or provide a default value
-    # Option 1: Filter out IDs that don't exist in mapping_dict
-    valid_mask = np.isin(ids_to_map, list(mapping_dict.keys()))
-    if not np.all(valid_mask):
-        print(f"Warning: Found {np.sum(~valid_mask)} orientation IDs that don't exist in surface points. These will be assigned a default value of 0.")
 
-    # Option 2: Use a default value (0) for missing IDs
-    mapped_array = np.vectorize(lambda x: mapping_dict.get(x, 0))(ids_to_map)
+def _add_instanced_arrows(gempy_vista: GemPyToVista, poly, arrows_factor: float, scale_by_vectors: bool,
+                          cmap=None, clim=None):
+    pv = require_pyvista()
+    import vtk
+
+    # * Same arrow geometry as the default of pyvista glyph
+    arrow_source = vtk.vtkArrowSource()
+    arrow_source.Update()
+
+    mapper = vtk.vtkGlyph3DMapper()
+    mapper.SetInputData(poly)
+    mapper.SetSourceData(pv.wrap(arrow_source.GetOutput()).compute_normals())
+    mapper.SetOrientationArray('vectors')
+    mapper.SetOrientationModeToDirection()
+    mapper.SetScaling(True)
+    mapper.SetScaleFactor(arrows_factor)
+    if scale_by_vectors:
+        mapper.SetScaleArray('vectors')
+        mapper.SetScaleModeToScaleByMagnitude()
+    else:
+        mapper.SetScaleModeToNoDataScaling()
 
-    return mapped_array
\ No newline at end of file
+    if cmap is None:
+        mapper.ScalarVisibilityOff()
+    else:
+        lookup_table = pv.LookupTable(cmap=cmap, n_values=256)
+        lookup_table.scalar_range = clim
+        mapper.SetScalarModeToUsePointFieldData()
+        mapper.SelectColorArray('id')
+        mapper.SetLookupTable(lookup_table)
+        mapper.SetUseLookupTableScalarRange(True)
+
+    actor = pv.Actor(mapper=mapper)
+    gempy_vista.p.add_actor(actor, reset_camera=False)
+    return actor
+
+
+def _set_arrow_outline_properties(actor, outline_color, outline_width, arrow_opacity):
+    actor.prop.style = 'wireframe'
+    actor.prop.color = outline_color
+    actor.prop.line_width = outline_width
+    actor.prop.opacity = arrow_opacity
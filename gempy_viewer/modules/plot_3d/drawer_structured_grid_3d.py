@@ -4,27 +4,42 @@ import numpy as np
 from matplotlib import colors as mcolors
 
 from gempy_engine.core.data.raw_arrays_solution import RawArraysSolution
+from gempy_engine.core.data.transforms import Transform
+from gempy_viewer.core.lru_cache import LRUCache
 from gempy_viewer.core.scalar_data_type import ScalarDataType
-from gempy.core.data.grid_modules import Topography
+from gempy.core.data.grid_modules import Topography, RegularGrid
 from gempy_viewer.modules.plot_3d.vista import GemPyToVista
-from gempy_viewer.optional_dependencies import require_pyvista
+from gempy_viewer.optional_dependencies import require_pyvista, require_scipy
+
+_REMAP_CHUNK_SIZE = 2 ** 22
+_REMAP_MAX_LUT_SIZE = 2 ** 16
+
+# * Grid geometry keyed by extent, resolution and transforms. Only the scalar arrays change between plots
+regular_grid_geometry_cache = LRUCache(max_size=4, max_bytes=2 * 2 ** 30)
+_ZYX_DIRECTION_MATRIX = np.array([[0, 0, 1], [0, 1, 0], [1, 0, 0]])
 
 
 def plot_structured_grid(
         gempy_vista: GemPyToVista,
-        vtk_formated_regular_mesh: np.ndarray,
-        resolution: np.ndarray,
+        vtk_formated_regular_mesh: Optional[np.ndarray],
+        resolution: Optional[np.ndarray],
         scalar_data_type: ScalarDataType,
         solution: RawArraysSolution,
         cmap: Union[mcolors.Colormap or str],
         active_scalar_field: Optional[str] = None,
         opacity=.5,
+        regular_grid: Optional[RegularGrid] = None,
+        input_transform: Optional[Transform] = None,
+        topography: Optional[Topography] = None,
         **kwargs
 ):
     pv = require_pyvista()
 
-    grid_3d = vtk_formated_regular_mesh.reshape(*(resolution + 1), 3).T
-    structured_grid = pv.StructuredGrid(*grid_3d)
+    if regular_grid is not None:
+        structured_grid = get_regular_grid_geometry(regular_grid, input_transform)
+    else:
+        grid_3d = vtk_formated_regular_mesh.reshape(*(resolution + 1), 3).T
+        structured_grid = pv.StructuredGrid(*grid_3d)
 
     # Set the scalar field-Activate it-getting cmap?
     structured_grid = set_scalar_data(
@@ -33,19 +48,27 @@ def plot_structured_grid(
         scalar_data_type=scalar_data_type
     )
 
+    topography_polydata: pv.PolyData = gempy_vista.surface_poly.get('topography', None)
+    if topography_polydata is not None:
+        if topography is not None and input_transform is None:
+            structured_grid = clip_with_height_field(
+                structured_grid=structured_grid,
+                topography=topography,
+                value=-10
+            )
+        else:  # * The height field is only known in model coordinates
+            structured_grid = structured_grid.clip_surface(
+                surface=topography_polydata,
+                value=-10,
+                crinkle=False,
+                invert=True
+            )
+
     structured_grid = set_active_scalar_fields(
         structured_grid=structured_grid,
         active_scalar_field=active_scalar_field
     )
-    topography_polydata: pv.PolyData = gempy_vista.surface_poly.get('topography', None)
-    if topography_polydata is not None:
-        structured_grid = structured_grid.clip_surface(
-            surface=topography_polydata,
-            value=-10,
-            crinkle=False,
-            invert=True
-        )
-        
+
     if active_scalar_field == 'lith':
         gempy_vista.regular_grid_actor = gempy_vista.p.add_mesh(
             mesh=structured_grid,
@@ -63,7 +86,159 @@ def plot_structured_grid(
             opacity=opacity,
             **kwargs
         )
-    
+    gempy_vista.regular_grid_mesh = structured_grid
+
+
+def set_active_regular_grid_field(
+        gempy_vista: GemPyToVista,
+        active_scalar_field: str,
+        cmap: Optional[Union[mcolors.Colormap or str]] = None
+):
+    """Switch the field shown by the regular grid actor without rebuilding the grid.
+
+    Only fields attached to the plotted grid can be activated, i.e. all of them when it was
+    plotted with ``ScalarDataType.ALL``.
+    """
+    structured_grid = gempy_vista.regular_grid_mesh
+    if structured_grid is None:
+        raise ValueError('No regular grid has been plotted yet.')
+
+    structured_grid = set_active_scalar_fields(
+        structured_grid=structured_grid,
+        active_scalar_field=active_scalar_field
+    )
+    mapper = gempy_vista.regular_grid_actor.mapper
+    mapper.array_name = structured_grid.active_scalars_name
+    mapper.scalar_range = structured_grid.get_data_range(structured_grid.active_scalars_name)
+    if cmap is not None:
+        n_values = cmap.N if isinstance(cmap, mcolors.ListedColormap) else 256
+        mapper.lookup_table.apply_cmap(cmap=cmap, n_values=n_values)
+
+    return gempy_vista.regular_grid_actor
+
+
+def get_regular_grid_geometry(regular_grid: RegularGrid, input_transform: Optional[Transform] = None) -> Union["pv.ImageData", "pv.StructuredGrid"]:
+    """Return the vtk geometry of ``regular_grid`` without any scalar data.
+
+    Axis-aligned grids become an implicit ``pv.ImageData`` (origin and spacing only) and
+    rotated grids fall back to an explicit ``pv.StructuredGrid``. The geometry is cached, so
+    repeated plots of the same grid only attach new scalar arrays to a shallow copy that
+    shares the points with the cached grid. If ``input_transform`` is passed the grid is
+    built in the transformed space.
+    """
+    key = _regular_grid_key(regular_grid, input_transform)
+    geometry = regular_grid_geometry_cache.get_or_create(
+        key=key,
+        factory=lambda: _build_regular_grid_geometry(regular_grid, input_transform)
+    )
+    return geometry.copy(deep=False)
+
+
+def clear_regular_grid_geometry_cache():
+    """Invalidate the cached regular grid geometries, e.g. after modifying a grid in place."""
+    regular_grid_geometry_cache.invalidate()
+
+
+def _regular_grid_key(regular_grid: RegularGrid, input_transform: Optional[Transform]) -> tuple:
+    return (
+        np.asarray(regular_grid.extent, dtype=float).tobytes(),
+        np.asarray(regular_grid.resolution, dtype=int).tobytes(),
+        regular_grid.transform.get_transform_matrix().tobytes(),
+        None if input_transform is None else input_transform.get_transform_matrix().tobytes()
+    )
+
+
+def _build_regular_grid_geometry(regular_grid: RegularGrid, input_transform: Optional[Transform]) -> Union["pv.ImageData", "pv.StructuredGrid"]:
+    pv = require_pyvista()
+    resolution = np.asarray(regular_grid.resolution)
+
+    # * Transform the grid origin and one cell step along each axis to find the grid basis
+    origin = np.array([regular_grid.extent[0], regular_grid.extent[2], regular_grid.extent[4]])
+    corners = _transform_regular_grid_points(
+        regular_grid=regular_grid,
+        input_transform=input_transform,
+        points=np.vstack([origin, origin + np.diag(regular_grid.dx_dy_dz)])
+    )
+    basis = corners[1:] - corners[0]
+    spacing = np.diag(basis)
+    is_axis_aligned = np.all(spacing > 0) and np.allclose(basis, np.diag(spacing), rtol=0, atol=1e-9 * spacing.max())
+
+    if is_axis_aligned:
+        # * vtk index i runs along z (as in the StructuredGrid below), so the C-ordered solution
+        # * arrays can be attached as cell data without reordering them
+        return pv.ImageData(
+            dimensions=resolution[::-1] + 1,
+            spacing=spacing[::-1],
+            origin=corners[0],
+            direction_matrix=_ZYX_DIRECTION_MATRIX
+        )
+
+    if input_transform is None:
+        vtk_formated_regular_mesh = regular_grid.get_values_vtk_format(orthogonal=False)
+    else:
+        vtk_formated_regular_mesh = input_transform.apply(regular_grid.get_values_vtk_format(orthogonal=True))
+
+    grid_3d = vtk_formated_regular_mesh.reshape(*(resolution + 1), 3).T
+    return pv.StructuredGrid(*grid_3d)
+
+
+def _transform_regular_grid_points(regular_grid: RegularGrid, input_transform: Optional[Transform],
+                                   points: np.ndarray) -> np.ndarray:
+    """Apply the same transforms as ``RegularGrid.get_values_vtk_format`` (plus the input transform)."""
+    if input_transform is not None:
+        return input_transform.apply(points)
+
+    return regular_grid.transform.apply_inverse_with_pivot(
+        points=points,
+        pivot=np.array([regular_grid.extent[0], regular_grid.extent[2], regular_grid.extent[4]])
+    )
+
+
+def clip_with_height_field(structured_grid: "pv.DataSet", topography: Topography, value: float = -10) -> "pv.UnstructuredGrid":
+    """Clip away the part of the grid above the topography.
+
+    Equivalent to ``clip_surface`` against the topography mesh, but since the topography is a
+    2.5D height field the clip scalar is just the height of each point above the DEM. That
+    needs one DEM interpolation per grid column instead of a distance query per point.
+    """
+    height_above_topography = _height_above_topography(structured_grid, topography)
+    structured_grid.point_data['height_above_topography'] = height_above_topography
+
+    clipped = structured_grid.clip_scalar(
+        scalars='height_above_topography',
+        value=value,
+        invert=True
+    )
+    clipped.point_data.remove('height_above_topography')
+    structured_grid.point_data.remove('height_above_topography')
+    return clipped
+
+
+def _height_above_topography(structured_grid: "pv.DataSet", topography: Topography) -> np.ndarray:
+    scipy = require_scipy()
+
+    values_2d = topography.values_2d
+    dem = scipy.interpolate.RegularGridInterpolator(
+        points=(values_2d[:, 0, 0], values_2d[0, :, 1]),
+        values=values_2d[:, :, 2],
+        bounds_error=False,
+        fill_value=None  # * Extrapolate beyond the DEM
+    )
+
+    pv = require_pyvista()
+    is_implicit = isinstance(structured_grid, pv.ImageData) and np.array_equal(structured_grid.direction_matrix, _ZYX_DIRECTION_MATRIX)
+    if not is_implicit:
+        points = structured_grid.points
+        return points[:, 2] - dem(points[:, :2])
+
+    # * Point index order is (x, y, z) with z fastest, so interpolate once per column and broadcast along z
+    nz, ny, nx = structured_grid.dimensions
+    dz, dy, dx = structured_grid.spacing
+    x0, y0, z0 = structured_grid.origin
+    xx, yy = np.meshgrid(x0 + dx * np.arange(nx), y0 + dy * np.arange(ny), indexing='ij')
+    column_heights = dem(np.stack((xx, yy), axis=-1))
+    z = z0 + dz * np.arange(nz)
+    return (z[None, None, :] - column_heights[:, :, None]).ravel()
 
 
 def _mask_topography(structured_grid: "pv.StructuredGrid", topography: Topography) -> "pv.StructuredGrid":
@@ -89,28 +264,88 @@ def set_scalar_data(
     
     # Substitute the madness of the previous if with match
     match scalar_data_type:
-        case ScalarDataType.LITHOLOGY | ScalarDataType.ALL:
-            unique_vals = np.sort(np.unique(data.lith_block))
-            lith_to_id = {int(v): i + 1 for i, v in enumerate(unique_vals)}
-            block_ = np.array([lith_to_id[int(v)] for v in data.lith_block.ravel()])
-            structured_grid.cell_data['id'] = block_
-        case ScalarDataType.SCALAR_FIELD | ScalarDataType.ALL:
-            scalar_field_ = 'sf_'
-            for e in range(data.scalar_field_matrix.shape[0]):
-                # TODO: Ideally we will have the group name instead the enumeration
-                array1 = data.scalar_field_matrix[e]
-                structured_grid[scalar_field_ + str(e)] = array1
-        case ScalarDataType.VALUES | ScalarDataType.ALL:
-            scalar_field_ = 'values_'
-            for e in range(data.values_matrix.shape[0]):
-                array2 = data.values_matrix[e]
-                structured_grid[scalar_field_ + str(e)] = array2
+        case ScalarDataType.LITHOLOGY:
+            _set_lith_data(structured_grid, data)
+        case ScalarDataType.SCALAR_FIELD:
+            _set_matrix_data(structured_grid, data.scalar_field_matrix, prefix='sf_')
+        case ScalarDataType.VALUES:
+            _set_matrix_data(structured_grid, data.values_matrix, prefix='values_')
+        case ScalarDataType.ALL:
+            # * One grid with every field so the active one can be switched without rebuilding the geometry
+            _set_lith_data(structured_grid, data)
+            _set_matrix_data(structured_grid, data.scalar_field_matrix, prefix='sf_')
+            _set_matrix_data(structured_grid, data.values_matrix, prefix='values_')
         case _:
             raise ValueError(f'Unknown scalar data type: {scalar_data_type}')
 
     return structured_grid  # , cmap
 
 
+def _set_lith_data(structured_grid: "pv.StructuredGrid", data: RawArraysSolution):
+    structured_grid.cell_data['id'] = lith_block_to_ids(data.lith_block)
+
+
+def _set_matrix_data(structured_grid: "pv.StructuredGrid", matrix: np.ndarray, prefix: str):
+    if matrix.ndim < 2:  # * Empty solution arrays are stored flat
+        return
+    for e in range(matrix.shape[0]):
+        # TODO: Ideally we will have the group name instead the enumeration
+        # * Rows of a C-contiguous matrix are views, so vtk wraps the solution buffer without copying
+        structured_grid.cell_data[prefix + str(e)] = np.ascontiguousarray(matrix[e])
+
+
+def lith_block_to_ids(lith_block: np.ndarray, chunk_size: int = _REMAP_CHUNK_SIZE) -> np.ndarray:
+    """Remap the lithology values to consecutive ids (1, 2, ...) sorted by value.
+
+    The remapping goes through a lookup table spanning the value range of the block, so it
+    is linear in the number of cells and only allocates ``chunk_size`` sized temporaries
+    besides the output. Values are truncated to integers as ``int(v)`` would do. The output
+    keeps the integer dtype of ``lith_block`` whenever the ids fit in it.
+    """
+    block = lith_block.ravel()
+    out_dtype = block.dtype if np.issubdtype(block.dtype, np.integer) else np.dtype(np.int32)
+    if block.size == 0:
+        return np.empty(0, dtype=out_dtype)
+
+    def _chunks():
+        for start in range(0, block.size, chunk_size):
+            chunk = block[start:start + chunk_size]
+            if not np.issubdtype(chunk.dtype, np.integer):
+                chunk = np.trunc(chunk)
+            yield start, chunk.astype(np.int64, copy=False)
+
+    min_val = int(np.trunc(block.min()))
+    span = int(np.trunc(block.max())) - min_val + 1
+
+    if span > _REMAP_MAX_LUT_SIZE:
+        # * Sparse values (e.g. ids in the millions): fall back to the sorted unique values
+        unique_vals = np.unique(np.concatenate([np.unique(chunk) for _, chunk in _chunks()]))
+        out_dtype = _id_dtype(out_dtype, unique_vals.size)
+        out = np.empty(block.size, dtype=out_dtype)
+        for start, chunk in _chunks():
+            out[start:start + chunk.size] = np.searchsorted(unique_vals, chunk) + 1
+        return out
+
+    present = np.zeros(span, dtype=bool)
+    for _, chunk in _chunks():
+        present[chunk - min_val] = True
+
+    lookup_table = np.cumsum(present)
+    out_dtype = _id_dtype(out_dtype, int(lookup_table[-1]))
+    lookup_table = lookup_table.astype(out_dtype)
+
+    out = np.empty(block.size, dtype=out_dtype)
+    for start, chunk in _chunks():
+        np.take(lookup_table, chunk - min_val, out=out[start:start + chunk.size])
+    return out
+
+
+def _id_dtype(dtype: np.dtype, max_id: int) -> np.dtype:
+    if max_id <= np.iinfo(dtype).max:
+        return dtype
+    return np.promote_types(dtype, np.min_scalar_type(max_id))
+
+
 def set_active_scalar_fields(structured_grid: "pv.StructuredGrid", active_scalar_field: Optional[str]) -> "pv.StructuredGrid":
     if active_scalar_field is None:
         active_scalar_field = structured_grid.array_names[0]
@@ -1,43 +1,259 @@
-﻿import numpy as np
+﻿import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from matplotlib.colors import ListedColormap
 
 from gempy.core.data.structural_element import StructuralElement
 from gempy_engine.core.data.transforms import Transform
 from gempy_viewer.modules.plot_3d.vista import GemPyToVista
 from ...optional_dependencies import require_pyvista
 
+_DEFAULT_LOD_REDUCTIONS = (0.5, 0.75, 0.9)
+
 
 def plot_surfaces(
         gempy_vista: GemPyToVista,
         structural_elements_with_solution: list[StructuralElement],
         input_transform: Transform = None,
         grid_transform: Transform = None,
+        merge_surfaces: bool = False,
+        n_workers: Optional[int] = None,
+        lod: Optional[Union[bool, dict]] = None,
         **kwargs
 ):
+    """Add the surfaces of the structural elements to the plotter.
+
+    The surface meshes are transformed and clipped against the topography concurrently in a
+    pool of ``n_workers`` threads (defaults to one per element, capped by the cpu count; ``1``
+    prepares them serially). The actors are added afterwards on the calling thread. The
+    preparation time of each element is stored in ``gempy_vista.surface_timings``.
+
+    With ``merge_surfaces`` all the surfaces are appended into one PolyData, tagged with an
+    ``element_id`` cell array, and drawn with a single actor coloured through a categorical
+    lookup table. Use :func:`set_surface_visibility` to toggle single elements in both modes.
+
+    ``lod`` (True or a dict) draws every surface from a pyramid of decimated meshes, built once and
+    cached in ``gempy_vista.surface_lods``. The dict accepts ``reductions`` (fraction of triangles
+    removed at each coarser level, defaults to ``(0.5, 0.75, 0.9)``) and either ``max_triangles``, to
+    pick once the finest level whose total triangle count fits the budget, or ``distance_factor``
+    (defaults to 1), to swap levels on every render by the camera distance relative to the size of
+    each surface.
+    """
+    if lod and merge_surfaces:
+        raise ValueError("lod is not supported together with merge_surfaces.")
+
     # ? Probably would be better to do the transformation somewhere else. But we leave it like this for now
     pv = require_pyvista()
     # ! If the order of the meshes does not match the order of scalar_field_at_surface points we need to reorder them in 'multi_scalar_dual_contouring.py'
     
     topography_mesh = gempy_vista.surface_poly.get('topography', None)
     
-    for element in structural_elements_with_solution:
-        vertices_ = element.vertices
-        edges_ = element.edges
-        if vertices_ is None or vertices_.shape[0] == 0 or edges_.shape[0] == 0:
+    prepared_surfaces = prepare_surfaces(
+        structural_elements=structural_elements_with_solution,
+        input_transform=input_transform,
+        grid_transform=grid_transform,
+        topography_mesh=topography_mesh,
+        n_workers=n_workers
+    )
+
+    plotted_elements = []
+    for element, (surf, elapsed) in zip(structural_elements_with_solution, prepared_surfaces):
+        if surf is None:
             continue
 
-        if grid_transform is not None:
-            vertices_ = grid_transform.apply_with_cached_pivot(vertices_)
-        if input_transform is not None:
-            vertices_ = input_transform.apply(vertices_)
-        surf = pv.PolyData(vertices_, np.insert(edges_, 0, 3, axis=1).ravel())
-        
-        if topography_mesh is not None:
-            surf = surf.clip_surface(topography_mesh, invert=True)
-        
+        gempy_vista.surface_timings[element.name] = elapsed
         gempy_vista.surface_poly[element.name] = surf
+        plotted_elements.append(element)
+        if merge_surfaces:
+            continue
+
         gempy_vista.surface_actors[element.name] = gempy_vista.p.add_mesh(
             surf,
             color=pv.Color(element.color).float_rgb,
             show_scalar_bar=False,
             **kwargs
         )
+
+    if merge_surfaces and len(plotted_elements) > 0:
+        _plot_merged_surfaces(gempy_vista, plotted_elements, **kwargs)
+
+    if lod:
+        set_surfaces_lod(
+            gempy_vista=gempy_vista,
+            elements_names=[element.name for element in plotted_elements],
+            **(lod if isinstance(lod, dict) else {})
+        )
+
+
+def set_surfaces_lod(gempy_vista: GemPyToVista, elements_names: list[str],
+                     reductions: Sequence[float] = _DEFAULT_LOD_REDUCTIONS,
+                     max_triangles: Optional[int] = None, distance_factor: float = 1.):
+    """Draw the surface actors of ``elements_names`` from their decimated pyramids. See :func:`plot_surfaces`."""
+    for name in elements_names:
+        surf = gempy_vista.surface_poly[name]
+        key = (surf.n_points, surf.n_cells, surf.bounds, tuple(reductions))
+        cached = gempy_vista.surface_lods.get(name, None)
+        if cached is None or cached[0] != key:
+            gempy_vista.surface_lods[name] = (key, build_surface_lod(surf, reductions))
+
+    if max_triangles is not None:
+        level = _lod_level_for_budget([gempy_vista.surface_lods[name][1] for name in elements_names], max_triangles)
+        for name in elements_names:
+            _set_lod_level(gempy_vista, name, level)
+        return
+
+    def _on_render(*args):
+        _update_lod_by_camera_distance(gempy_vista, elements_names, distance_factor)
+
+    if gempy_vista.surface_lod_observer is not None:
+        gempy_vista.p.renderer.RemoveObserver(gempy_vista.surface_lod_observer)
+    gempy_vista.surface_lod_observer = gempy_vista.p.renderer.AddObserver('StartEvent', _on_render)
+
+
+def build_surface_lod(surf, reductions: Sequence[float] = _DEFAULT_LOD_REDUCTIONS) -> list:
+    """Return ``surf`` followed by its quadric decimations removing each fraction of ``reductions``."""
+    if surf.n_cells == 0:
+        return [surf] * (len(reductions) + 1)
+
+    levels = [surf]
+    previous_mesh = surf if surf.is_all_triangles else surf.triangulate()
+    previous_reduction = 0.
+    for reduction in reductions:
+        # * Each level decimates the previous one, so the relative reduction is used
+        relative_reduction = 1 - (1 - reduction) / (1 - previous_reduction)
+        previous_mesh = previous_mesh.decimate(relative_reduction)
+        previous_reduction = reduction
+        levels.append(previous_mesh)
+    return levels
+
+
+def _lod_level_for_budget(pyramids: list[list], max_triangles: int) -> int:
+    n_levels = min(len(levels) for levels in pyramids)
+    for level in range(n_levels):
+        if sum(levels[level].n_cells for levels in pyramids) <= max_triangles:
+            return level
+    return n_levels - 1
+
+
+def _update_lod_by_camera_distance(gempy_vista: GemPyToVista, elements_names: list[str], distance_factor: float):
+    camera_position = np.array(gempy_vista.p.camera.position)
+    for name in elements_names:
+        levels = gempy_vista.surface_lods[name][1]
+        distance = np.linalg.norm(camera_position - np.array(levels[0].center))
+        # * One level coarser every time the distance doubles beyond the size of the surface
+        ratio = distance / max(levels[0].length * distance_factor, np.finfo(float).tiny)
+        level = int(np.clip(np.floor(np.log2(max(ratio, np.finfo(float).tiny))) + 1, 0, len(levels) - 1))
+        _set_lod_level(gempy_vista, name, level)
+
+
+def _set_lod_level(gempy_vista: GemPyToVista, element_name: str, level: int):
+    mesh = gempy_vista.surface_lods[element_name][1][level]
+    mapper = gempy_vista.surface_actors[element_name].mapper
+    if mapper.GetInput() is not mesh:
+        mapper.dataset = mesh
+
+
+def prepare_surfaces(structural_elements: list[StructuralElement], input_transform: Transform = None,
+                     grid_transform: Transform = None, topography_mesh=None,
+                     n_workers: Optional[int] = None) -> list[tuple]:
+    """Build the (clipped) surface mesh of every element in a thread pool.
+
+    Returns a ``(surface, seconds)`` tuple per element in the input order. ``surface`` is None
+    for elements without vertices.
+    """
+    if n_workers is None:
+        n_workers = min(len(structural_elements), os.cpu_count() or 1)
+
+    def _timed_prepare_surface(element: StructuralElement) -> tuple:
+        start = time.perf_counter()
+        # * Each thread clips against its own shallow copy: vtk builds the cell links of the input lazily
+        element_topography = topography_mesh.copy(deep=False) if topography_mesh is not None else None
+        surf = _prepare_surface(element, input_transform, grid_transform, element_topography)
+        return surf, time.perf_counter() - start
+
+    if n_workers <= 1:
+        return [_timed_prepare_surface(element) for element in structural_elements]
+
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(_timed_prepare_surface, structural_elements))
+
+
+def set_surface_visibility(gempy_vista: GemPyToVista, element_name: str, visible: bool = True):
+    """Show or hide the surface of one structural element, whether it was plotted merged or not."""
+    if visible:
+        gempy_vista.hidden_surfaces.discard(element_name)
+    else:
+        gempy_vista.hidden_surfaces.add(element_name)
+
+    actor = gempy_vista.surface_actors.get(element_name, None)
+    if actor is not None:
+        actor.SetVisibility(visible)
+
+    merged_mesh = gempy_vista.surfaces_merged_mesh
+    if merged_mesh is None:
+        return
+
+    # * Hidden cells are removed from the mapped mesh, updated in place. The full mesh is kept to restore them
+    elements_names = list(merged_mesh.field_data['element_names'])
+    hidden_ids = [elements_names.index(name) for name in gempy_vista.hidden_surfaces if name in elements_names]
+    hidden_cells = np.isin(merged_mesh.cell_data['element_id'], hidden_ids)
+
+    merged_actor = gempy_vista.surfaces_merged_actor
+    merged_actor.SetVisibility(not hidden_cells.all())
+    if hidden_cells.all():
+        return
+
+    shown_mesh = merged_actor.mapper.dataset
+    if hidden_cells.any():
+        shown_mesh.copy_from(merged_mesh.remove_cells(hidden_cells, inplace=False), deep=False)
+    else:
+        shown_mesh.copy_from(merged_mesh, deep=False)
+
+
+def _prepare_surface(element: StructuralElement, input_transform: Transform, grid_transform: Transform,
+                     topography_mesh):
+    pv = require_pyvista()
+
+    vertices_ = element.vertices
+    edges_ = element.edges
+    if vertices_ is None or vertices_.shape[0] == 0 or edges_.shape[0] == 0:
+        return None
+
+    if grid_transform is not None:
+        vertices_ = grid_transform.apply_with_cached_pivot(vertices_)
+    if input_transform is not None:
+        vertices_ = input_transform.apply(vertices_)
+    surf = pv.PolyData(vertices_, np.insert(edges_, 0, 3, axis=1).ravel())
+
+    if topography_mesh is not None:
+        surf = surf.clip_surface(topography_mesh, invert=True)
+        if surf.n_cells == 0:
+            return None  # * Eroded away by the topography
+    return surf
+
+
+def _plot_merged_surfaces(gempy_vista: GemPyToVista, elements: list[StructuralElement], **kwargs):
+    pv = require_pyvista()
+
+    surfaces = [gempy_vista.surface_poly[element.name] for element in elements]
+    merged_mesh = pv.merge(surfaces, merge_points=False)
+    merged_mesh.cell_data['element_id'] = np.repeat(
+        np.arange(len(surfaces), dtype=np.int32),
+        [surf.n_cells for surf in surfaces]
+    )
+    merged_mesh.field_data['element_names'] = [element.name for element in elements]
+
+    n_elements = len(elements)
+    gempy_vista.surfaces_merged_mesh = merged_mesh
+    gempy_vista.surfaces_merged_actor = gempy_vista.p.add_mesh(
+        merged_mesh.copy(deep=False),
+        scalars='element_id',
+        cmap=ListedColormap([element.color for element in elements]),
+        clim=(-.5, n_elements - .5),
+        n_colors=n_elements,
+        show_scalar_bar=False,
+        **kwargs
+    )
@@ -1,15 +1,26 @@
-﻿from typing import Optional
+﻿from dataclasses import dataclass
+from typing import Optional, Sequence, Union
 
 import numpy as np
 import matplotlib.colors as mcolors
 
 from gempy.core.data.grid_modules import Topography
+from gempy_viewer.core.topography_contours import get_topography_contours
 from gempy_viewer.core.scalar_data_type import TopographyDataType
 from gempy_engine.core.data.raw_arrays_solution import RawArraysSolution
 from gempy_viewer.modules.plot_3d.vista import GemPyToVista
 from ...optional_dependencies import require_pyvista
 
 
+@dataclass
+class TopographyTile:
+    """Block of the topography height field drawn at the resolution chosen by the camera."""
+    levels: list  # * PolyData of every level, finest first
+    errors: np.ndarray  # * Maximum height error of every level against the full resolution block
+    bounds: np.ndarray
+    actor: Optional[object] = None
+
+
 def plot_topography_3d(
         gempy_vista: GemPyToVista,
         topography: Topography,
@@ -17,16 +28,25 @@ def plot_topography_3d(
         topography_scalar_type: TopographyDataType,
         elements_colors: list[str],
         contours=True,
+        adaptive: Optional[Union[bool, dict]] = None,
+        contour_levels: Optional[Sequence[float]] = None,
+        contour_interval: Optional[float] = None,
         **kwargs
 ):
-    pv = require_pyvista()
-    
-    rgb = False
+    """Plot the topography colored by height or by the geological map.
 
-    xx, yy = np.meshgrid(topography.y, topography.x)
+    The isolines are drawn at ``contour_levels`` or every ``contour_interval`` (round levels over the
+    heights by default) and shared with the 2D topography through the cache of
+    :func:`gempy_viewer.core.topography_contours.get_topography_contours`.
 
-    grid = pv.StructuredGrid(yy, xx, topography.values_2d[:, :, 2])
-    polydata = grid.extract_surface(algorithm="dataset_surface")
+    ``adaptive`` (True or a dict with ``tile_size`` and ``max_pixel_error``) splits the height field
+    into tiles, each one with a pyramid of subsampled meshes, and draws every tile at the coarsest
+    level whose height error projects to less than ``max_pixel_error`` pixels for the current camera.
+    The tiles are stored in ``gempy_vista.topography_tiles`` and a list of their actors is returned.
+    """
+    n_colors = 256
+
+    polydata = get_topography_mesh(gempy_vista, topography)
 
     if solution is None:
         is_geological_map = False
@@ -36,50 +56,225 @@ def plot_topography_3d(
     
     match topography_scalar_type, is_geological_map:
         case TopographyDataType.GEOMAP, True:
-            colors_hex = elements_colors
-            colors_rgb_ = [list(mcolors.hex2color(val)) for val in colors_hex]  # Convert hex to RGB using list comprehension
-
-            colors_rgb = np.array(colors_rgb_) * 255  # Multiply by 255 to get RGB values in [0, 255]
-            sel = np.round(geological_map).astype(int) - 1
-            selected_colors = colors_rgb[sel]  # Use numpy advanced indexing to get the corresponding RGB values
-            scalars_val = pv.convert_array(selected_colors, array_type=3)  # Convert to vtk array
-
-            cm = mcolors.ListedColormap(elements_colors)
-            rgb = True
+            # * Categorical ids plus a lookup table instead of per vertex rgb colors
+            scalars_val = geological_map_to_ids(geological_map)
+            cm = geological_map_cmap(elements_colors)
+            n_colors = cm.N
 
             show_scalar_bar = False
             scalars = 'id'
-            clim = (0, len(elements_colors) - 1),
+            clim = (-.5, n_colors - .5)
+            # * Interpolating the ids would draw the units in between at every contact
+            interpolate_before_map = False
 
         case TopographyDataType.SCALARS, True:
             raise NotImplementedError('Not implemented yet')
             clim = None
         case _:  # * Plot topography 
-            scalars_val = topography.values[:, 2]
+            scalars_val = None
             cm = 'terrain'
             clim = None
             show_scalar_bar = True
             scalars = 'height'
+            interpolate_before_map = None
 
-    polydata['id'] = scalars_val
-    polydata['height'] = topography.values[:, 2]
+    if scalars_val is not None:
+        polydata['id'] = scalars_val
 
-    topography_actor = gempy_vista.p.add_mesh(
-        polydata,
-        scalars=scalars,
-        cmap=cm,
-        rgb=rgb,
-        show_scalar_bar=False,
-        clim= clim,
-        **kwargs
-    )
+    if adaptive:
+        # * Shared color range, otherwise every tile would be scaled to its own heights
+        clim = clim if clim is not None else polydata.get_data_range('height')
+        topography_actor = plot_adaptive_topography(
+            gempy_vista=gempy_vista,
+            topography=topography,
+            ids=scalars_val,
+            kwargs_add_mesh=dict(scalars=scalars, cmap=cm, n_colors=n_colors, show_scalar_bar=False, clim=clim,
+                                 interpolate_before_map=interpolate_before_map, **kwargs),
+            **(adaptive if isinstance(adaptive, dict) else {})
+        )
+    else:
+        topography_actor = gempy_vista.p.add_mesh(
+            polydata,
+            scalars=scalars,
+            cmap=cm,
+            n_colors=n_colors,
+            show_scalar_bar=False,
+            clim= clim,
+            interpolate_before_map=interpolate_before_map,
+            **kwargs
+        )
+        gempy_vista.surface_actors["topography"] = topography_actor
 
     if contours is True:
-        contours = polydata.contour(scalars='height')
-        contours_actor = gempy_vista.p.add_mesh(contours, color="white", line_width=3)
+        levels, lines = get_topography_contours(topography, levels=contour_levels, interval=contour_interval)
+        contours = contour_lines_to_polydata(levels, lines)
+        if contours.n_points > 0:
+            contours_actor = gempy_vista.p.add_mesh(contours, color="white", line_width=3)
+            gempy_vista.surface_poly['topography_cont'] = contours
+            gempy_vista.surface_actors["topography_cont"] = contours_actor
+    return topography_actor
+
 
+def get_topography_mesh(gempy_vista: GemPyToVista, topography: Topography):
+    """Topography surface cached in ``gempy_vista.surface_poly['topography']``, built on first use."""
+    polydata = gempy_vista.surface_poly.get('topography', None)
+    if polydata is None or polydata.n_points != topography.values.shape[0]:
+        polydata = topography_to_polydata(topography)
         gempy_vista.surface_poly['topography'] = polydata
-        gempy_vista.surface_poly['topography_cont'] = contours
-        gempy_vista.surface_actors["topography"] = topography_actor
-        gempy_vista.surface_actors["topography_cont"] = contours_actor
-    return topography_actor
+    return polydata
+
+
+def topography_to_polydata(topography: Topography):
+    """Quad mesh of the topography height field with a ``height`` point array.
+
+    The points are ``topography.values`` (x major, as ``values_2d``), so no grid is materialized.
+    """
+    nx, ny = topography.values_2d.shape[:2]
+    polydata = _lattice_polydata(topography.values, nx, ny)
+    polydata['height'] = topography.values[:, 2]
+    return polydata
+
+
+def plot_adaptive_topography(gempy_vista: GemPyToVista, topography: Topography, ids: Optional[np.ndarray],
+                             kwargs_add_mesh: dict, tile_size: int = 257, max_pixel_error: float = 2.) -> list:
+    """Draw the topography as tiles whose level is updated before every render. See :func:`plot_topography_3d`."""
+    tiles = build_topography_tiles(topography, ids=ids, tile_size=tile_size)
+    for tile in tiles:
+        tile.actor = gempy_vista.p.add_mesh(tile.levels[-1], **kwargs_add_mesh)
+    gempy_vista.topography_tiles = tiles
+
+    def _on_render(*args):
+        update_topography_tiles(gempy_vista, max_pixel_error)
+
+    if gempy_vista.topography_tiles_observer is not None:
+        gempy_vista.p.renderer.RemoveObserver(gempy_vista.topography_tiles_observer)
+    gempy_vista.topography_tiles_observer = gempy_vista.p.renderer.AddObserver('StartEvent', _on_render)
+    return [tile.actor for tile in tiles]
+
+
+def build_topography_tiles(topography: Topography, ids: Optional[np.ndarray] = None,
+                           tile_size: int = 257) -> list[TopographyTile]:
+    """Split the height field in tiles of ``tile_size`` vertices a side sharing their edges.
+
+    Every tile holds the meshes subsampled every 1, 2, 4... vertices, always keeping its edges, with the
+    ``height`` and (if given) geological map ``id`` of the sampled vertices, so the coloring matches on
+    every level.
+    """
+    values_2d = topography.values_2d
+    nx, ny = values_2d.shape[:2]
+    ids_2d = ids.reshape(nx, ny) if ids is not None else None
+
+    step = max(tile_size - 1, 1)
+    tiles = []
+    for x_start in range(0, max(nx - 1, 1), step):
+        for y_start in range(0, max(ny - 1, 1), step):
+            tile_slice = (slice(x_start, x_start + step + 1), slice(y_start, y_start + step + 1))
+            tiles.append(_build_topography_tile(
+                points_2d=values_2d[tile_slice],
+                ids_2d=ids_2d[tile_slice] if ids_2d is not None else None
+            ))
+    return tiles
+
+
+def update_topography_tiles(gempy_vista: GemPyToVista, max_pixel_error: float = 2.):
+    """Show every tile at the coarsest level whose height error stays below ``max_pixel_error`` on screen."""
+    camera = gempy_vista.p.camera
+    position = np.array(camera.position)
+    window_height = gempy_vista.p.window_size[1]
+
+    for tile in gempy_vista.topography_tiles:
+        if camera.parallel_projection:
+            pixels_per_unit = window_height / (2 * camera.parallel_scale)
+        else:
+            closest_point = np.clip(position, tile.bounds[::2], tile.bounds[1::2])
+            distance = max(np.linalg.norm(position - closest_point), np.finfo(float).eps)
+            pixels_per_unit = window_height / (2 * distance * np.tan(np.radians(camera.view_angle) / 2))
+
+        # * Errors grow with the level, so this is the last level within the tolerance
+        level = max(int(np.searchsorted(tile.errors * pixels_per_unit, max_pixel_error, side='right')) - 1, 0)
+        mesh = tile.levels[level]
+        if tile.actor.mapper.dataset is not mesh:
+            tile.actor.mapper.dataset = mesh
+
+
+def _build_topography_tile(points_2d: np.ndarray, ids_2d: Optional[np.ndarray]) -> TopographyTile:
+    nx, ny = points_2d.shape[:2]
+    full_height = points_2d[..., 2]
+
+    levels, errors = [], []
+    stride = 1
+    while True:
+        x_index, y_index = _strided_index(nx, stride), _strided_index(ny, stride)
+        coarse_points = points_2d[x_index][:, y_index]
+
+        mesh = _lattice_polydata(coarse_points.reshape(-1, 3), x_index.shape[0], y_index.shape[0])
+        mesh['height'] = coarse_points[..., 2].ravel()
+        if ids_2d is not None:
+            mesh['id'] = ids_2d[x_index][:, y_index].ravel()
+        levels.append(mesh)
+
+        # * Bilinear interpolation of the coarse heights back on the full resolution vertices
+        interpolated_height = _linear_weights(nx, x_index) @ coarse_points[..., 2] @ _linear_weights(ny, y_index).T
+        error = np.abs(interpolated_height - full_height).max()
+        errors.append(max(error, errors[-1]) if errors else error)
+
+        if x_index.shape[0] <= 2 and y_index.shape[0] <= 2:
+            break
+        stride *= 2
+
+    bounds = np.array(levels[0].bounds)
+    return TopographyTile(levels=levels, errors=np.array(errors), bounds=bounds)
+
+
+def _strided_index(n: int, stride: int) -> np.ndarray:
+    return np.unique(np.append(np.arange(0, n, stride), n - 1))
+
+
+def _linear_weights(n: int, index: np.ndarray) -> np.ndarray:
+    """(n, len(index)) matrix interpolating linearly from the samples at ``index`` to every position."""
+    return np.stack([np.interp(np.arange(n), index, column) for column in np.eye(index.shape[0])], axis=1)
+
+
+def _lattice_polydata(points: np.ndarray, nx: int, ny: int):
+    pv = require_pyvista()
+
+    # * Lower left corner of every quad, then its four corners counter clockwise
+    corners = (np.arange(nx - 1)[:, None] * ny + np.arange(ny - 1)[None, :]).ravel()
+    faces = np.empty((corners.shape[0], 5), dtype=pv.ID_TYPE)
+    faces[:, 0] = 4
+    faces[:, 1] = corners
+    faces[:, 2] = corners + ny
+    faces[:, 3] = corners + ny + 1
+    faces[:, 4] = corners + 1
+    return pv.PolyData(points, faces.ravel())
+
+
+def contour_lines_to_polydata(levels: np.ndarray, lines: list[list[np.ndarray]]):
+    """Polylines at the height of their level from the xy lines of :func:`get_topography_contours`."""
+    pv = require_pyvista()
+
+    level_lines = [(level, line) for level, lines_of_level in zip(levels, lines) for line in lines_of_level]
+    if len(level_lines) == 0:
+        return pv.PolyData()
+
+    points = np.concatenate([np.column_stack((line, np.full(line.shape[0], level))) for level, line in level_lines])
+    lengths = np.array([line.shape[0] for _, line in level_lines])
+    offsets = np.cumsum(lengths) - lengths
+    cells = np.concatenate([np.r_[length, offset:offset + length] for length, offset in zip(lengths, offsets)])
+
+    polydata = pv.PolyData(points, lines=cells)
+    polydata['height'] = points[:, 2]
+    return polydata
+
+
+def geological_map_to_ids(geological_map: np.ndarray) -> np.ndarray:
+    """Round the geological map into uint8 ids without any float temporary."""
+    ids = np.empty(geological_map.shape, dtype=np.uint8)
+    np.rint(geological_map, out=ids, casting='unsafe')
+    return ids
+
+
+def geological_map_cmap(elements_colors: list[str]) -> mcolors.ListedColormap:
+    """Colormap over the ids 0..n of :func:`geological_map_to_ids`. Id ``i`` takes the color ``i - 1``, 0 the last one."""
+    n_elements = len(elements_colors)
+    return mcolors.ListedColormap([elements_colors[(i - 1) % n_elements] for i in range(n_elements + 1)])
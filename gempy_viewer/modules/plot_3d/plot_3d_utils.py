@@ -44,8 +44,11 @@ def set_scalar_bar(gempy_vista: GemPyToVista, elements_names: list[str],
         mapper_actor = gempy_vista.regular_grid_actor
     elif gempy_vista.surface_points_actor is not None:
         mapper_actor: pv.Actor = gempy_vista.surface_points_actor
-    elif gempy_vista.surface_actors is not None:
-        mapper_actor: pv.Actor = next(iter(gempy_vista.surface_actors.values()))
+    elif (len(gempy_vista.surface_actors) > 0 or len(gempy_vista.topography_tiles) > 0
+          or gempy_vista.surfaces_merged_actor is not None):
+        # * The surface actors (e.g. the topography geological map or the merged surfaces) are colored
+        # * through their own lookup tables, so the bar gets a mapper of its own
+        mapper_actor: pv.Actor = pv.Actor(mapper=pv.DataSetMapper())
     else:
         return None  # * Not a good mapper for the scalar bar
 
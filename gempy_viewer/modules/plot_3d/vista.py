@@ -99,6 +99,14 @@ class GemPyToVista:
         # Actors containers
         self.surface_actors = {}
         self.surface_poly = {}
+        self.surfaces_merged_mesh = None
+        self.surfaces_merged_actor = None
+        self.hidden_surfaces = set()
+        self.surface_timings = {}
+        self.surface_lods = {}
+        self.surface_lod_observer = None
+        self.topography_tiles = []
+        self.topography_tiles_observer = None
 
         self.regular_grid_actor = None
         self.regular_grid_mesh = None
@@ -0,0 +1,42 @@
+import time
+
+import numpy as np
+import pytest
+
+from gempy.core.data.orientations import OrientationsTable
+from gempy.core.data.surface_points import SurfacePointsTable
+
+from gempy_viewer.modules.plot_3d.drawer_input_3d import plot_orientations
+from gempy_viewer.modules.plot_3d.vista import GemPyToVista
+
+
+@pytest.mark.skipif(condition=True, reason="Run explicitly to benchmark the orientation arrows")
+def test_benchmark_instanced_arrows():
+    rng = np.random.default_rng(1234)
+    n_orientations = 100_000
+    names = rng.choice(['rock1', 'rock2', 'rock3'], size=n_orientations)
+    xyz = rng.random((n_orientations, 3)) * 1000
+    grads = rng.normal(size=(n_orientations, 3))
+
+    orientations = OrientationsTable.from_arrays(*xyz.T, *grads.T, names=names)
+    surface_points = SurfacePointsTable.from_arrays(*xyz.T, names=names)
+
+    timings = {}
+    for instanced_arrows in (False, True):
+        gempy_vista = GemPyToVista(extent=[0, 1000, 0, 1000, 0, 1000], pyvista_camera_kwargs={}, off_screen=True)
+        start = time.perf_counter()
+        plot_orientations(
+            gempy_vista=gempy_vista,
+            orientations=orientations,
+            surface_points=surface_points,
+            arrows_factor=10,
+            element_colors=['#015482', '#9f0052', '#ffbe00'],
+            instanced_arrows=instanced_arrows
+        )
+        gempy_vista.p.render()
+        timings[instanced_arrows] = time.perf_counter() - start
+        gempy_vista.p.close()
+
+        print(f"instanced_arrows={instanced_arrows}: {timings[instanced_arrows]:.3f} s")
+
+    assert timings[True] < timings[False]
@@ -0,0 +1,39 @@
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from gempy_viewer.core.input_data_arrays import InputDataArrays
+
+
+@pytest.mark.skipif(condition=True, reason="Run explicitly to benchmark the projection of input data on sections")
+def test_benchmark_projection_spatial_index():
+    rng = np.random.default_rng(1234)
+    n_points = 1_000_000
+    input_arrays = InputDataArrays(
+        points_xyz=rng.random((n_points, 3)) * 10_000,
+        orientations_xyz=rng.random((1000, 3)) * 10_000,
+        orientations_gradients=rng.normal(size=(1000, 3))
+    )
+    sections = rng.random((50, 2, 2)) * 10_000
+    x, y = np.meshgrid(np.linspace(0, 10_000, 70), np.linspace(0, 10_000, 70))
+    surface_xyz = np.column_stack([x.ravel(), y.ravel(), np.full(x.size, 5000.)])
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for section_start, section_stop in sections:
+        input_arrays.select_near_segment(section_start, section_stop, 50.)
+    sections_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    input_arrays.select_near_surface(surface_xyz, 50.)
+    surface_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{n_points} points, {len(sections)} sections: {sections_time:.3f} s, "
+          f"topography: {surface_time:.3f} s, peak {peak / 2 ** 20:.1f} MiB")
+
+    # * cdist between the topography and the points alone would take 4900 * 10^6 * 8 bytes
+    assert peak < 4900 * n_points * 8 / 100
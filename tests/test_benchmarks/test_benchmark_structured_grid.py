@@ -0,0 +1,61 @@
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from gempy_viewer.modules.plot_3d.drawer_structured_grid_3d import lith_block_to_ids, _REMAP_CHUNK_SIZE
+
+
+@pytest.mark.skipif(condition=True, reason="Run explicitly to benchmark the lith block remapping")
+def test_benchmark_lith_block_to_ids():
+    rng = np.random.default_rng(1234)
+    timings = {}
+    for n_cells in (1_000_000, 10_000_000, 100_000_000):
+        lith_block = rng.integers(2, 9, size=n_cells, dtype=np.int8)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        ids = lith_block_to_ids(lith_block)
+        timings[n_cells] = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{n_cells:>11d} cells: {timings[n_cells]:.3f} s, peak {peak / 2 ** 20:.1f} MiB")
+
+        # * Output plus a handful of chunk sized int64 temporaries
+        assert peak < ids.nbytes + 4 * _REMAP_CHUNK_SIZE * 8
+        assert ids.dtype == lith_block.dtype
+
+    # * Linear scaling: 100x the cells should not cost much more than 100x the time
+    assert timings[100_000_000] < 200 * timings[1_000_000]
+
+
+@pytest.mark.skipif(condition=True, reason="Run explicitly to benchmark the topography clipping")
+def test_benchmark_clip_with_height_field():
+    import pyvista as pv
+    from gempy.core.data.grid_modules import RegularGrid, Topography
+    from gempy_viewer.modules.plot_3d.drawer_structured_grid_3d import get_regular_grid_geometry, clip_with_height_field
+
+    extent = np.array([0, 2000, 0, 2000, 0, 1000.])
+    regular_grid = RegularGrid(extent=extent, resolution=np.array([100, 100, 100]))
+
+    x, y = np.linspace(0, 2000, 200), np.linspace(0, 2000, 200)
+    xx, yy = np.meshgrid(x, y, indexing='ij')
+    height = 600 + 200 * np.sin(xx / 300) * np.cos(yy / 400)
+    topography = Topography(_regular_grid=regular_grid, values_2d=np.stack((xx, yy, height), axis=-1))
+    topography_polydata = pv.StructuredGrid(xx, yy, height).extract_surface(algorithm="dataset_surface")
+
+    structured_grid = get_regular_grid_geometry(regular_grid)
+
+    start = time.perf_counter()
+    clipped_surface = structured_grid.clip_surface(topography_polydata, value=-10, crinkle=False, invert=True)
+    time_surface = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clipped_height_field = clip_with_height_field(structured_grid, topography, value=-10)
+    time_height_field = time.perf_counter() - start
+
+    print(f"clip_surface: {time_surface:.3f} s, height field: {time_height_field:.3f} s")
+    assert np.isclose(clipped_height_field.volume, clipped_surface.volume, rtol=0.01)
+    assert time_height_field < time_surface
@@ -0,0 +1,30 @@
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from gempy_viewer.modules.plot_3d.drawer_topography_3d import geological_map_to_ids, geological_map_cmap
+
+
+@pytest.mark.skipif(condition=True, reason="Run explicitly to benchmark the geological map coloring")
+def test_benchmark_geological_map_coloring():
+    rng = np.random.default_rng(1234)
+    n_vertices = 4000 * 4000
+    geological_map = rng.integers(1, 5, size=n_vertices).astype(np.float64)
+    elements_colors = ['#015482', '#9f0052', '#ffbe00', '#728f02']
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    ids = geological_map_to_ids(geological_map)
+    cmap = geological_map_cmap(elements_colors)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{n_vertices} vertices: {elapsed:.3f} s, peak {peak / 2 ** 20:.1f} MiB")
+
+    # * One byte per vertex. The previous float64 rgb colors took 24 bytes per vertex plus temporaries
+    assert ids.dtype == np.uint8
+    assert peak < 1.1 * n_vertices
+    assert cmap.N == len(elements_colors) + 1
@@ -0,0 +1,77 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.path import Path
+
+from gempy_viewer.core.contour_lines import contour_overlay, image_contour_lines
+
+
+def test_image_contour_lines_match_matplotlib_contour():
+    y, x = np.mgrid[0:30, 0:40]
+    image = np.hypot(x - 20, y - 15)
+    levels = [4., 9.5]
+    extent = (0, 2000, 1000, 0)  # * Inverted vertical axis, as in sections below the topography
+
+    _, ax = plt.subplots()
+    contour_set = ax.contour(image, levels=levels, origin='lower', extent=extent)
+    plt.close(ax.figure)
+
+    lines_per_level = image_contour_lines(image, levels, extent)
+    assert len(lines_per_level) == len(levels)
+    for lines, expected_lines in zip(lines_per_level, contour_set.allsegs):
+        assert len(lines) == len(expected_lines)
+        for line, expected_line in zip(lines, expected_lines):
+            np.testing.assert_allclose(line, expected_line)
+
+    assert image_contour_lines(image, [], extent) == []
+
+
+def test_contour_overlay_matches_matplotlib_contour_and_contourf():
+    y, x = np.mgrid[0:30, 0:40]
+    image = np.hypot(x - 20, y - 15)
+    extent = (0, 2000, -500, 500)
+
+    _, ax = plt.subplots()
+    lines_set = ax.contour(image, extent=extent)
+    filled_set = ax.contourf(image, extent=extent)
+    plt.close(ax.figure)
+
+    levels, lines, polygons, codes = contour_overlay(image, extent, dtype=np.float64)
+    np.testing.assert_array_equal(levels, lines_set.levels)
+    np.testing.assert_array_equal(levels, filled_set.levels)
+    for level_lines, expected_lines in zip(lines, lines_set.allsegs):
+        expected_lines = [line for line in expected_lines if len(line)]  # * Empty levels hold an empty array
+        assert len(level_lines) == len(expected_lines)
+        for line, expected_line in zip(level_lines, expected_lines):
+            np.testing.assert_allclose(line, expected_line)
+
+    assert len(polygons) == len(codes) == len(levels) - 1
+    # * The polygons may start and turn differently than matplotlib's, but cover the same bands
+    for band_polygons, band_codes, expected_path in zip(polygons, codes, filled_set.get_paths()):
+        path = Path(np.concatenate(band_polygons), np.concatenate(band_codes))
+        np.testing.assert_allclose(_area(path), _area(expected_path))
+
+
+def _area(path):
+    # * Holes run opposite to their outer boundary, so the signed areas subtract them
+    return abs(sum(
+        np.sum(x[:-1] * y[1:] - x[1:] * y[:-1]) / 2
+        for x, y in (polygon.T for polygon in path.to_polygons())
+    ))
+
+
+def test_contour_overlay_float32():
+    y, x = np.mgrid[0:30, 0:40]
+    image = np.hypot(x - 20, y - 15)
+    extent = (0, 2000, -500, 500)
+
+    levels, lines, _, _ = contour_overlay(image, extent, levels=[4., 9.5])
+    levels_64, lines_64, _, _ = contour_overlay(image, extent, levels=[4., 9.5], dtype=np.float64)
+    np.testing.assert_array_equal(levels, levels_64)
+    for level_lines, level_lines_64 in zip(lines, lines_64):
+        np.testing.assert_allclose(np.concatenate(level_lines), np.concatenate(level_lines_64), atol=1e-3)
+
+    assert len(contour_overlay(image, extent, levels=4)[0]) > 1
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from gempy_viewer.core.ids_mapping import first_appearance_rank, vectorize_ids
+
+
+def _vectorize_ids_dict(mapping_ids, ids_to_map):
+    """Previous dictionary based implementation, kept as reference."""
+    unique_values, first_indices = np.unique(mapping_ids, return_index=True)
+    unique_values_order = unique_values[np.argsort(first_indices)][::-1]
+    mapping_dict = {value: i + 1 for i, value in enumerate(unique_values_order)}
+    return np.vectorize(lambda x: mapping_dict.get(x, 0))(ids_to_map)
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.filterwarnings("ignore:Found .* orientation IDs")
+def test_vectorize_ids_matches_dict_mapping(seed):
+    rng = np.random.default_rng(seed)
+    n_elements = rng.integers(1, 30)
+    elements_ids = rng.choice(2 ** 31 - 1, size=n_elements, replace=False).astype(np.int32)
+
+    mapping_ids = rng.choice(elements_ids, size=rng.integers(1, 500))
+    ids_to_map = rng.choice(np.concatenate([elements_ids, [-1, 7, 2 ** 31 - 1]]), size=rng.integers(1, 500))
+
+    np.testing.assert_array_equal(vectorize_ids(mapping_ids, mapping_ids), _vectorize_ids_dict(mapping_ids, mapping_ids))
+    np.testing.assert_array_equal(vectorize_ids(mapping_ids, ids_to_map), _vectorize_ids_dict(mapping_ids, ids_to_map))
+
+
+def test_first_appearance_rank():
+    ranks = first_appearance_rank(
+        mapping_ids=[30, 30, 10, 20, 10],
+        ids_to_map=np.array([10, 20, 30, 40, 5])
+    )
+    np.testing.assert_array_equal(ranks, [1, 2, 0, -1, -1])
+    assert first_appearance_rank([], [1, 2]).tolist() == [-1, -1]
+    assert vectorize_ids([1, 2], np.array([], dtype=np.int32)).shape == (0,)
+
+
+def test_vectorize_ids_warns_on_missing_ids():
+    with pytest.warns(UserWarning, match="1 orientation IDs"):
+        assert vectorize_ids([5, 6], [5, 7]).tolist() == [2, 0]
+
+
+def test_data_colors_reject_unknown_ids():
+    from gempy_viewer.API._plot_2d_sections_api import _colors_per_id
+
+    colors = _colors_per_id([5, 6], np.array(['#ff0000', '#00ff00']), np.array([6, 5, 6]), 'surface points')
+    assert colors.tolist() == ['#00ff00', '#ff0000', '#00ff00']
+    with pytest.raises(ValueError, match="2 surface points"):
+        _colors_per_id([5, 6], np.array(['#ff0000', '#00ff00']), np.array([6, 9, 9]), 'surface points')
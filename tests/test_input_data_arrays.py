@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from gempy_viewer.core.input_data_arrays import InputDataArrays
+
+
+def _random_input_arrays(seed, n_points=2000, n_orientations=300):
+    rng = np.random.default_rng(seed)
+    return InputDataArrays(
+        points_xyz=rng.random((n_points, 3)) * 1000,
+        orientations_xyz=rng.random((n_orientations, 3)) * 1000,
+        orientations_gradients=rng.normal(size=(n_orientations, 3))
+    )
+
+
+def _near_segment_brute_force(xy, start, stop, distance):
+    length = np.linalg.norm(stop - start)
+    direction = (stop - start) / length
+    along = (xy - start) @ direction
+    across = np.linalg.norm(xy - start - along[:, None] * direction, axis=1)
+    return (across < distance) & (along >= 0) & (along <= length)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_select_near_segment_matches_brute_force(seed):
+    input_arrays = _random_input_arrays(seed)
+    rng = np.random.default_rng(seed)
+    start, stop = rng.random((2, 2)) * 1000
+    distance = rng.choice([0.5, 20., 300.])
+
+    select_p, select_o = input_arrays.select_near_segment(start, stop, distance)
+    np.testing.assert_array_equal(select_p, _near_segment_brute_force(input_arrays.points_xyz[:, :2], start, stop, distance))
+    np.testing.assert_array_equal(select_o, _near_segment_brute_force(input_arrays.orientations_xyz[:, :2], start, stop, distance))
+
+
+def test_select_near_surface_matches_cdist():
+    input_arrays = _random_input_arrays(0)
+    x, y = np.meshgrid(np.linspace(0, 1000, 30), np.linspace(0, 1000, 30))
+    surface_xyz = np.column_stack([x.ravel(), y.ravel(), 500 + 100 * np.sin(x.ravel() / 100)])
+
+    select_p, select_o = input_arrays.select_near_surface(surface_xyz, 60)
+    np.testing.assert_array_equal(select_p, (cdist(surface_xyz, input_arrays.points_xyz) < 60).any(axis=0))
+    np.testing.assert_array_equal(select_o, (cdist(surface_xyz, input_arrays.orientations_xyz) < 60).any(axis=0))
+    assert 0 < select_p.sum() < select_p.shape[0]
+
+
+@pytest.mark.parametrize("axis", range(3))
+def test_select_in_slab_matches_scan(axis):
+    input_arrays = _random_input_arrays(axis)
+    select_p, select_o = input_arrays.select_in_slab(axis, 420., 35.)
+
+    np.testing.assert_array_equal(select_p, np.abs(input_arrays.points_xyz[:, axis] - 420.) < 35.)
+    np.testing.assert_array_equal(select_o, np.abs(input_arrays.orientations_xyz[:, axis] - 420.) < 35.)
+    assert 0 < select_p.sum() < select_p.shape[0]
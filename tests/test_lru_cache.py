@@ -0,0 +1,30 @@
+import numpy as np
+
+from gempy_viewer.core.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+
+
+def test_lru_cache_memory_bound_and_counters():
+    cache = LRUCache(max_size=10, max_bytes=3 * 800)
+    for i in range(5):
+        cache.get_or_create(i, lambda: np.zeros(100))
+    cache.get_or_create(4, lambda: np.zeros(100))
+
+    assert len(cache) == 3
+    assert cache.nbytes == 3 * 800
+    assert (cache.hits, cache.misses) == (1, 5)
+
+    cache.invalidate(4)
+    assert 4 not in cache
+    cache.invalidate()
+    assert len(cache) == 0
@@ -41,6 +41,41 @@ class TestPlot2DInputData:
             show_section_traces=False,  # TODO: Test this one
         )
 
+    def test_plot_2d_section_projection_shares_input_arrays(self, one_fault_model_no_interp):
+        from gempy_viewer.core.input_data_arrays import InputDataArrays
+
+        geo_model = one_fault_model_no_interp
+        gp.set_section_grid(
+            grid=geo_model.grid,
+            section_dict={'section_SW-NE': ([250, 250], [1750, 1750], [100, 100])}
+        )
+        input_arrays = InputDataArrays.from_geo_model(geo_model)
+        points_xyz = input_arrays.points_xyz.copy()
+
+        p2d = gpv.plot_2d(
+            model=geo_model,
+            section_names=['section_SW-NE'],
+            cell_number=['mid'],
+            direction=['y'],
+            show_results=False,
+            show=False
+        )
+        assert not input_arrays.points_xyz.flags.writeable
+        np.testing.assert_array_equal(geo_model.surface_points_copy.xyz, points_xyz)
+
+        # * Points on a section are drawn at their distance along it
+        section_slicer, orthogonal_slicer = (section_data.slicer_data for section_data in p2d.section_data_list)
+        selected_xyz = points_xyz[section_slicer.select_projected_p]
+        expected_x = np.abs((selected_xyz[:, 0] - 250) + (selected_xyz[:, 1] - 250)) / np.sqrt(2)
+        np.testing.assert_allclose(section_slicer.points_xy, np.column_stack([expected_x, selected_xyz[:, 2]]))
+        np.testing.assert_array_equal(orthogonal_slicer.points_xy, points_xyz[orthogonal_slicer.select_projected_p][:, [0, 2]])
+
+        # * Orthogonal sections select a slab around the center of the plotted cells
+        regular_grid = geo_model.grid.regular_grid
+        slice_y = regular_grid.y_coord[int(regular_grid.resolution[1] / 2)]
+        projection_distance = 0.2 * geo_model.input_transform.isometric_scale
+        np.testing.assert_array_equal(orthogonal_slicer.select_projected_p, np.abs(points_xyz[:, 1] - slice_y) < projection_distance)
+
     def test_plot_2d_topography(self, one_fault_model_no_interp):
         gp.set_topography_from_random(
             grid=one_fault_model_no_interp.grid,
@@ -56,6 +91,25 @@ class TestPlot2DInputData:
             show_section_traces=False,  # TODO: Test this one
         )
 
+    def test_plot_2d_flat_topography(self):
+        geo_model = _one_fault_model_generator()
+        gp.set_topography_from_random(
+            grid=geo_model.grid,
+            fractal_dimension=1.2,
+            d_z=np.array([600, 2000]),
+            topography_resolution=np.array([60, 60])
+        )
+        geo_model.grid.topography.values_2d[:, :, 2] = 800.
+
+        p2d = gpv.plot_2d(
+            model=geo_model,
+            section_names=['topography'],
+            show_topography=True,
+            show_section_traces=False,
+            show=False
+        )
+        assert len(p2d.axes[0].images) > 0
+
     def test_plot_2d_topography_and_sections(self, one_fault_model_no_interp):
         gp.set_section_grid(
             grid=one_fault_model_no_interp.grid,
@@ -147,6 +201,253 @@ class TestPlot2DSolutions:
             show_section_traces=True  # TODO: Test this one
         )
 
+    def test_section_topography_profiles(self, one_fault_model_topo_solution):
+        from gempy_viewer.core.section_data_2d import SectionType
+        from gempy_viewer.modules.plot_2d.drawer_topography_2d import section_topography_profiles
+        from gempy.core.data.core_utils import calculate_line_coordinates_2points, interpolate_zvals_at_xy
+        from gempy_viewer.modules.plot_2d.plot_2d_utils import calculate_p1p2
+
+        def slice_topo_4_sections(grid, p1, p2, resx):
+            xy = calculate_line_coordinates_2points(p1, p2, resx)
+            return xy[:, 0], xy[:, 1], interpolate_zvals_at_xy(xy, grid.topography)
+
+        p2d = gpv.plot_2d(
+            model=one_fault_model_topo_solution,
+            section_names=['section_SW-NE', 'section_NW-SE', 'topography'],
+            direction=['x', 'y'], cell_number=['mid', 3],
+            show_topography=True,
+            show=False
+        )
+        grid = one_fault_model_topo_solution.grid
+        profiles = section_topography_profiles(grid, p2d.section_data_list)
+        assert set(profiles) == {'section_SW-NE', 'section_NW-SE', ('x', 'mid'), ('y', 3)}
+
+        for section_data in p2d.section_data_list:
+            if section_data.section_type is SectionType.SECTION and section_data.section_name != 'topography':
+                p1, p2 = grid.sections.df.loc[section_data.section_name, ['start', 'stop']]
+                expected = slice_topo_4_sections(grid, p1, p2, grid.topography.resolution[0])
+                profile = profiles[section_data.section_name]
+            elif section_data.section_type is SectionType.ORTHOGONAL:
+                p1, p2 = calculate_p1p2(grid.regular_grid, section_data.direction, section_data.cell_number)
+                expected = slice_topo_4_sections(grid, p1, p2, grid.regular_grid.resolution[0])
+                profile = profiles[(section_data.direction, section_data.cell_number)]
+            else:
+                continue
+            np.testing.assert_allclose(np.array(profile), np.array(expected))
+
+    def test_slice_topo_4_sections_method_deprecated(self, one_fault_model_topo_solution):
+        from gempy_viewer.modules.plot_2d.plot_2d_utils import slice_topo_4_sections
+
+        grid = one_fault_model_topo_solution.grid
+        profile = slice_topo_4_sections(grid, [250, 250], [1750, 1750], 50)
+        with pytest.warns(DeprecationWarning, match='method is deprecated'):
+            deprecated_profile = slice_topo_4_sections(grid, [250, 250], [1750, 1750], 50, method='interp2d')
+        np.testing.assert_array_equal(np.array(profile), np.array(deprecated_profile))
+
+    def test_plot_2d_slice_cache(self, one_fault_model_topo_solution):
+        from matplotlib.collections import LineCollection
+        from gempy_viewer.API._plot_2d_sections_api import plot_sections
+        from gempy_viewer.core.data_to_show import DataToShow
+        from gempy_viewer.modules.plot_2d.plot_2d_utils import regular_grid_slice
+
+        show = dict(show_scalar=[True, False, False], show_boundaries=True, show_topography=False)
+        p2d = gpv.plot_2d(
+            model=one_fault_model_topo_solution,
+            direction=['y', 'y', 'x'], cell_number=[3, 3, 'mid'],
+            show=False,
+            **show
+        )
+
+        def contacts(ax):
+            return [collection for collection in ax.collections if isinstance(collection, LineCollection)][0]
+
+        # * The repeated panel shows the same lithology and contacts
+        first, repeated, _ = p2d.axes
+        np.testing.assert_array_equal(first.images[0].get_array(), repeated.images[0].get_array())
+        assert len(contacts(first).get_segments()) > 0
+        for segment, repeated_segment in zip(contacts(first).get_segments(), contacts(repeated).get_segments()):
+            np.testing.assert_array_equal(segment, repeated_segment)
+
+        # * Drawing the panels again extracts nothing new
+        misses = p2d.slice_cache.misses
+        plot_sections(
+            gempy_model=one_fault_model_topo_solution,
+            sections_data=p2d.section_data_list,
+            data_to_show=DataToShow(n_axis=3, **show),
+            series_n=[0, 0, 0],
+            legend=False,
+            slice_cache=p2d.slice_cache
+        )
+        assert p2d.slice_cache.misses == misses
+
+        raw_arrays = one_fault_model_topo_solution.solutions.raw_arrays
+        resolution = one_fault_model_topo_solution.grid.regular_grid.resolution
+        slicer_data = p2d.section_data_list[0].slicer_data
+        image = regular_grid_slice(raw_arrays.scalar_field_matrix[0], resolution, slicer_data, p2d.slice_cache)
+        assert image.flags.c_contiguous
+        np.testing.assert_array_equal(image, raw_arrays.scalar_field_matrix[0].reshape(resolution)[:, 3, :].T)
+
+    def test_plot_2d_contacts_line_collection(self, one_fault_model_topo_solution):
+        from matplotlib.collections import LineCollection
+        from gempy_viewer.modules.plot_2d.drawer_contours_2d import plot_regular_grid_contacts
+
+        p2d = gpv.plot_2d(
+            model=one_fault_model_topo_solution,
+            direction=['y'], cell_number=[3],
+            show_lith=False,
+            show_boundaries=False,
+            show=False
+        )
+        ax = p2d.axes[0]
+        kwargs = dict(
+            gempy_model=one_fault_model_topo_solution,
+            ax=ax,
+            slicer_data=p2d.section_data_list[0].slicer_data,
+            resolution=one_fault_model_topo_solution.grid.regular_grid.resolution,
+            slice_cache=p2d.slice_cache
+        )
+        contacts = plot_regular_grid_contacts(**kwargs)
+        assert isinstance(contacts, LineCollection) and contacts in ax.collections
+        assert len(contacts.get_segments()) > 0
+
+        # * Drawing again reuses the slices and their lines
+        misses = p2d.slice_cache.misses
+        redrawn = plot_regular_grid_contacts(**kwargs)
+        assert p2d.slice_cache.misses == misses
+        for segment, redrawn_segment in zip(contacts.get_segments(), redrawn.get_segments()):
+            np.testing.assert_array_equal(segment, redrawn_segment)
+
+    def test_plot_2d_section_contacts(self, one_fault_model_topo_solution):
+        from matplotlib.collections import LineCollection
+        from gempy_viewer.modules.plot_2d.drawer_contours_2d import section_contact_lines
+
+        section_names = ['section_SW-NE', 'section_NW-SE', 'topography']
+        p2d = gpv.plot_2d(
+            model=one_fault_model_topo_solution,
+            section_names=section_names,
+            show_lith=False,
+            show_boundaries=True,
+            show=False
+        )
+        for ax in p2d.axes:
+            contacts = [collection for collection in ax.collections if isinstance(collection, LineCollection)]
+            assert len(contacts) == 1 and len(contacts[0].get_segments()) > 0
+
+        contact_lines = section_contact_lines(one_fault_model_topo_solution, section_names)
+        n_scalar_fields = one_fault_model_topo_solution.solutions.raw_arrays.scalar_field_matrix.shape[0]
+        for section_name in section_names:
+            segments_per_group, colors_per_group = contact_lines[section_name]
+            assert len(segments_per_group) == len(colors_per_group) == n_scalar_fields
+            assert [len(segments) for segments in segments_per_group] == [len(colors) for colors in colors_per_group]
+
+        # * Lines run along the section within the vertical extent of the model
+        dist = one_fault_model_topo_solution.grid.sections.df.loc['section_SW-NE', 'dist']
+        vertices = np.concatenate([segment for segments in contact_lines['section_SW-NE'][0] for segment in segments])
+        extent = one_fault_model_topo_solution.grid.regular_grid.extent
+        assert np.all((vertices[:, 0] >= 0) & (vertices[:, 0] <= dist))
+        assert np.all((vertices[:, 1] >= extent[4]) & (vertices[:, 1] <= extent[5]))
+
+    def test_plot_2d_section_scalar_field(self, one_fault_model_topo_solution):
+        from matplotlib.contour import ContourSet
+        from gempy_viewer.modules.plot_2d.drawer_scalar_field_2d import plot_section_scalar_field
+
+        p2d = gpv.plot_2d(
+            model=one_fault_model_topo_solution,
+            section_names=['section_SW-NE', 'section_SW-NE', 'topography'],
+            show_scalar=True,
+            show_lith=False,
+            show_boundaries=False,
+            show_topography=False,
+            show=False
+        )
+        def contour_sets(ax):
+            return sorted(
+                (collection for collection in ax.collections if isinstance(collection, ContourSet)),
+                key=lambda contour_set: contour_set.filled
+            )
+
+        for ax in p2d.axes:
+            assert [contour_set.filled for contour_set in contour_sets(ax)] == [False, True]
+
+        # * The repeated section shows the same overlay, drawn from the cache
+        for contour_set, repeated_contour_set in zip(contour_sets(p2d.axes[0]), contour_sets(p2d.axes[1])):
+            np.testing.assert_array_equal(contour_set.levels, repeated_contour_set.levels)
+            for path, repeated_path in zip(contour_set.get_paths(), repeated_contour_set.get_paths()):
+                np.testing.assert_array_equal(path.vertices, repeated_path.vertices)
+
+        misses = p2d.slice_cache.misses
+        plot_section_scalar_field(
+            gempy_model=one_fault_model_topo_solution,
+            ax=p2d.axes[0],
+            section_name='section_SW-NE',
+            slice_cache=p2d.slice_cache
+        )
+        assert p2d.slice_cache.misses == misses
+
+    def test_plot_2d_many_panels(self, one_fault_model_topo_solution):
+        resolution = one_fault_model_topo_solution.grid.regular_grid.resolution
+        cell_number = [i % resolution[1] for i in range(12)]
+        p2d = gpv.plot_2d(
+            model=one_fault_model_topo_solution,
+            section_names=['section_SW-NE', 'topography'],
+            direction='y',
+            cell_number=cell_number,
+            show_lith=False,
+            show_boundaries=False,
+            show=False
+        )
+        assert len(p2d.axes) == 14
+        positions = {tuple(np.round(ax.get_position().bounds, 6)) for ax in p2d.axes}
+        assert len(positions) == 14
+
+    def test_plot_2d_pages(self, one_fault_model_topo_solution, tmp_path):
+        import re
+        from matplotlib.contour import ContourSet
+
+        resolution = one_fault_model_topo_solution.grid.regular_grid.resolution
+        cell_number = [i % resolution[1] for i in range(10)]
+        show_scalar = [False] * 10 + [True]
+        pdf_path = tmp_path / 'sections.pdf'
+
+        pages = gpv.plot_2d_pages(
+            model=one_fault_model_topo_solution,
+            section_names=['section_SW-NE'],
+            direction='y',
+            cell_number=cell_number,
+            panels_per_page=4,
+            pdf_path=pdf_path,
+            show_scalar=show_scalar,
+            show_lith=False,
+            show_boundaries=False,
+            show=False
+        )
+        assert [len(page.axes) for page in pages] == [4, 4, 3]
+        assert pages[0].section_data_list[0].section_name == 'section_SW-NE'
+        assert [data.cell_number for page in pages for data in page.section_data_list[-3:]][-3:] == cell_number[-3:]
+        assert len(re.findall(rb'/Type\s*/Page[^s]', pdf_path.read_bytes())) == 3
+
+        # * Per panel arguments follow their panel: only the last one shows the scalar field
+        shows_scalar = [
+            any(isinstance(collection, ContourSet) for collection in ax.collections)
+            for page in pages for ax in page.axes
+        ]
+        assert shows_scalar == show_scalar
+
+    def test_plot_2d_pages_figsize_not_split(self, one_fault_model_topo_solution):
+        pages = gpv.plot_2d_pages(
+            model=one_fault_model_topo_solution,
+            direction=['y', 'x'],
+            cell_number=[2, 3],
+            panels_per_page=1,
+            figsize=[12, 8],
+            show_lith=False,
+            show_boundaries=False,
+            show=False
+        )
+        assert [len(page.axes) for page in pages] == [1, 1]
+        for page in pages:
+            np.testing.assert_allclose(page.fig.get_size_inches(), [12, 8])
+
     def test_ve(self, one_fault_model_topo_solution):
         # Test ve
         p2d = gpv.plot_2d(one_fault_model_topo_solution, direction='x', cell_number='mid',
@@ -107,6 +107,46 @@ class TestPlot3DSolutions:
             hash='07600210000'
         )
 
+    def test_plot_3d_all_scalar_fields(self, one_fault_model_topo_solution):
+        from gempy_viewer.modules.plot_3d.drawer_structured_grid_3d import set_active_regular_grid_field
+        plot3d = gpv.plot_3d(
+            model=one_fault_model_topo_solution,
+            show_topography=False,
+            all_scalar_fields=True,
+            show=False
+        )
+
+        regular_grid_mesh = plot3d.regular_grid_mesh
+        assert regular_grid_mesh.active_scalars_name == 'id'
+        assert {'id', 'sf_0', 'sf_1'}.issubset(regular_grid_mesh.array_names)
+        assert np.shares_memory(
+            regular_grid_mesh.cell_data['sf_1'],
+            one_fault_model_topo_solution.solutions.raw_arrays.scalar_field_matrix
+        )
+
+        set_active_regular_grid_field(plot3d, 'sf_1', cmap='magma')
+        assert plot3d.regular_grid_actor.mapper.array_name == 'sf_1'
+        assert plot3d.regular_grid_mesh is regular_grid_mesh
+        plot3d.p.close()
+
+    def test_plot_3d_regular_grid_geometry_cache(self, one_fault_model_topo_solution):
+        from gempy_viewer.modules.plot_3d.drawer_structured_grid_3d import regular_grid_geometry_cache, clear_regular_grid_geometry_cache
+        clear_regular_grid_geometry_cache()
+        misses, hits = regular_grid_geometry_cache.misses, regular_grid_geometry_cache.hits
+        kwargs = dict(model=one_fault_model_topo_solution, show_topography=False, show_data=False,
+                      show_boundaries=False, show=False)
+
+        first = gpv.plot_3d(**kwargs)
+        second = gpv.plot_3d(active_scalar_field='sf_1', show_scalar=True, **kwargs)
+
+        assert regular_grid_geometry_cache.misses == misses + 1
+        assert regular_grid_geometry_cache.hits > hits
+        # * Axis-aligned grids are implicit, so there are no points to copy at all
+        assert type(first.regular_grid_mesh).__name__ == 'ImageData'
+        assert first.regular_grid_mesh.origin == second.regular_grid_mesh.origin
+        first.p.close()
+        second.p.close()
+
     def test_plot_3d_solutions_topography(self, one_fault_model_topo_solution):
         plot3d =gpv.plot_3d(
             model=one_fault_model_topo_solution,
@@ -134,6 +174,150 @@ class TestPlot3DSolutions:
             hash='07040030001'
         )
 
+    def test_plot_3d_geological_map_not_interpolated(self, one_fault_model_topo_solution):
+        # * Colors are blended between vertices, not the ids, so no units appear at the contacts
+        for adaptive in (False, True):
+            plot3d = gpv.plot_3d(
+                model=one_fault_model_topo_solution,
+                show_data=False,
+                show_lith=False,
+                show_boundaries=False,
+                show_topography=True,
+                topography_scalar_type=TopographyDataType.GEOMAP,
+                kwargs_plot_topography={'adaptive': adaptive, 'contours': False},
+                show=False
+            )
+            actors = [tile.actor for tile in plot3d.topography_tiles] if adaptive else [plot3d.surface_actors['topography']]
+            assert len(actors) > 0
+            assert not any(actor.mapper.GetInterpolateScalarsBeforeMapping() for actor in actors)
+            plot3d.p.close()
+
+    def test_plot_3d_merged_surfaces(self, one_fault_model_topo_solution):
+        from gempy_viewer.modules.plot_3d.drawer_surfaces_3d import set_surface_visibility
+
+        plot3d = gpv.plot_3d(
+            model=one_fault_model_topo_solution,
+            show_data=False,
+            show_lith=False,
+            show_topography=False,
+            kwargs_plot_surfaces={'merge_surfaces': True},
+            show=False
+        )
+
+        merged_mesh = plot3d.surfaces_merged_mesh
+        shown_mesh = plot3d.surfaces_merged_actor.mapper.dataset
+        elements_names = list(merged_mesh.field_data['element_names'])
+        assert shown_mesh.n_cells == merged_mesh.n_cells
+        assert not set(elements_names) & set(plot3d.surface_actors)
+        assert merged_mesh.n_cells == sum(plot3d.surface_poly[name].n_cells for name in elements_names)
+        assert list(plot3d.p.scalar_bars.keys()) == ['Elements']
+
+        set_surface_visibility(plot3d, elements_names[0], visible=False)
+        shown_ids = shown_mesh.cell_data['element_id']
+        assert 0 not in shown_ids
+        assert shown_ids.shape[0] == merged_mesh.n_cells - plot3d.surface_poly[elements_names[0]].n_cells
+
+        set_surface_visibility(plot3d, elements_names[0], visible=True)
+        assert shown_mesh.n_cells == merged_mesh.n_cells
+        plot3d.p.close()
+
+    def test_plot_3d_surfaces_thread_pool(self, one_fault_model_topo_solution):
+        from gempy_viewer.modules.plot_3d.drawer_surfaces_3d import prepare_surfaces
+
+        plot3d = gpv.plot_3d(
+            model=one_fault_model_topo_solution,
+            show_data=False,
+            show_lith=False,
+            kwargs_plot_surfaces={'n_workers': 4},
+            show=False
+        )
+        elements = one_fault_model_topo_solution.structural_frame.structural_elements
+        serial_surfaces = prepare_surfaces(elements, topography_mesh=plot3d.surface_poly['topography'], n_workers=1)
+
+        for element, (surf, elapsed) in zip(elements, serial_surfaces):
+            if surf is None:
+                continue
+            np.testing.assert_array_equal(surf.points, plot3d.surface_poly[element.name].points)
+            np.testing.assert_array_equal(surf.faces, plot3d.surface_poly[element.name].faces)
+            assert plot3d.surface_timings[element.name] >= 0
+        plot3d.p.close()
+
+
+    def test_plot_3d_instanced_arrows(self, one_fault_model_topo_solution):
+        import vtk
+
+        plot3d = gpv.plot_3d(
+            model=one_fault_model_topo_solution,
+            show_results=False,
+            kwargs_plot_data={'instanced_arrows': True},
+            show=False
+        )
+
+        assert isinstance(plot3d.orientations_actor.GetMapper(), vtk.vtkGlyph3DMapper)
+        assert plot3d.orientations_mesh.n_points == one_fault_model_topo_solution.orientations_copy.xyz.shape[0]
+        plot3d.p.close()
+
+
+    def test_plot_3d_surfaces_lod(self, one_fault_model_topo_solution):
+        def shown_cells(plot3d):
+            return [plot3d.surface_actors[name].mapper.GetInput().GetNumberOfCells() for name in plot3d.surface_lods]
+
+        plot3d = gpv.plot_3d(
+            model=one_fault_model_topo_solution,
+            show_data=False,
+            show_lith=False,
+            kwargs_plot_surfaces={'lod': {'max_triangles': 1000}},
+            show=False
+        )
+        assert sum(shown_cells(plot3d)) <= 1000
+        for name, (key, levels) in plot3d.surface_lods.items():
+            assert levels[0] is plot3d.surface_poly[name]
+        plot3d.p.close()
+
+        plot3d = gpv.plot_3d(
+            model=one_fault_model_topo_solution,
+            show_data=False,
+            show_lith=False,
+            kwargs_plot_surfaces={'lod': True},
+            kwargs_plotter={'off_screen': True},
+            show=False
+        )
+        plot3d.p.show(auto_close=False)
+        plot3d.p.camera.position = tuple(np.array(plot3d.p.camera.focal_point) + 1e6)
+        plot3d.p.render()
+        assert shown_cells(plot3d) == [levels[-1].n_cells for key, levels in plot3d.surface_lods.values()]
+
+        plot3d.p.camera.position = plot3d.surface_poly[next(iter(plot3d.surface_lods))].center
+        plot3d.p.render()
+        assert shown_cells(plot3d)[0] == plot3d.surface_poly[next(iter(plot3d.surface_lods))].n_cells
+        plot3d.p.close()
+
+
+    def test_plot_3d_surfaces_lod_clipped_away(self, one_fault_model_topo_solution):
+        import pyvista as pv
+        from gempy_viewer.modules.plot_3d.drawer_surfaces_3d import build_surface_lod, plot_surfaces
+        from gempy_viewer.modules.plot_3d.vista import GemPyToVista
+
+        extent = one_fault_model_topo_solution.grid.regular_grid.extent
+        gempy_vista = GemPyToVista(extent=extent, pyvista_camera_kwargs={}, off_screen=True)
+        # * A topography below the whole model erodes every surface
+        center = ((extent[0] + extent[1]) / 2, (extent[2] + extent[3]) / 2, extent[4] - 1000)
+        gempy_vista.surface_poly['topography'] = pv.Plane(center=center, i_size=1e5, j_size=1e5)
+
+        elements = one_fault_model_topo_solution.structural_frame.structural_elements
+        plot_surfaces(
+            gempy_vista=gempy_vista,
+            structural_elements_with_solution=elements,
+            input_transform=one_fault_model_topo_solution.input_transform,
+            grid_transform=one_fault_model_topo_solution.grid.transform,
+            lod=True
+        )
+        assert not any(element.name in gempy_vista.surface_actors for element in elements)
+        assert gempy_vista.surface_lods == {}
+        gempy_vista.p.close()
+
+        assert [level.n_cells for level in build_surface_lod(pv.PolyData(), reductions=(0.5, 0.9))] == [0, 0, 0]
+
 
 class TestPlot2DSolutionsOctrees:
     @pytest.fixture(scope='class')
@@ -165,3 +349,121 @@ class TestPlot2DSolutionsOctrees:
 
     def test_plot_3d_solutions_default(self, one_fault_model_topo_solution_octrees):
         gpv.plot_3d(one_fault_model_topo_solution_octrees, image=True)
+
+
+class TestRegularGridGeometry:
+    @pytest.mark.parametrize("rotation, geometry_type", [(0., 'ImageData'), (30., 'StructuredGrid')])
+    def test_regular_grid_geometry_matches_vtk_coordinates(self, rotation, geometry_type):
+        import pyvista as pv
+        from gempy.core.data.grid_modules import RegularGrid
+        from gempy_engine.core.data.transforms import Transform
+        from gempy_viewer.modules.plot_3d.drawer_structured_grid_3d import get_regular_grid_geometry
+
+        regular_grid = RegularGrid(
+            extent=np.array([0, 2000, 0, 1000, -500, 0.]),
+            resolution=np.array([4, 3, 2]),
+            transform=Transform(position=np.zeros(3), rotation=np.array([0, 0, rotation]), scale=np.ones(3))
+        )
+        geometry = get_regular_grid_geometry(regular_grid)
+        vtk_formated_regular_mesh = regular_grid.get_values_vtk_format()
+        structured_grid = pv.StructuredGrid(*vtk_formated_regular_mesh.reshape(*(regular_grid.resolution + 1), 3).T)
+
+        assert type(geometry).__name__ == geometry_type
+        assert np.allclose(geometry.points, structured_grid.points)
+        assert np.allclose(geometry.cell_centers().points, structured_grid.cell_centers().points)
+
+    def test_clip_with_height_field_matches_clip_surface(self):
+        import pyvista as pv
+        from gempy.core.data.grid_modules import RegularGrid, Topography
+        from gempy_viewer.modules.plot_3d.drawer_structured_grid_3d import get_regular_grid_geometry, clip_with_height_field
+
+        regular_grid = RegularGrid(extent=np.array([0, 2000, 0, 2000, 0, 1000.]), resolution=np.array([20, 15, 10]))
+        xx, yy = np.meshgrid(np.linspace(0, 2000, 40), np.linspace(0, 2000, 30), indexing='ij')
+        height = 600 + 200 * np.sin(xx / 300) * np.cos(yy / 400)
+        topography = Topography(_regular_grid=regular_grid, values_2d=np.stack((xx, yy, height), axis=-1))
+        topography_polydata = pv.StructuredGrid(xx, yy, height).extract_surface(algorithm="dataset_surface")
+
+        structured_grid = get_regular_grid_geometry(regular_grid)
+        clipped_surface = structured_grid.clip_surface(topography_polydata, value=-10, crinkle=False, invert=True)
+        clipped_height_field = clip_with_height_field(structured_grid, topography, value=-10)
+
+        assert np.isclose(clipped_height_field.volume, clipped_surface.volume, rtol=0.02)
+        assert 'height_above_topography' not in clipped_height_field.array_names
+
+
+class TestTopography3D:
+    def test_geological_map_ids_match_rgb_indexing(self):
+        import matplotlib.colors as mcolors
+        from gempy_viewer.modules.plot_3d.drawer_topography_3d import geological_map_to_ids, geological_map_cmap
+
+        elements_colors = ['#015482', '#9f0052', '#ffbe00', '#728f02']
+        geological_map = np.array([1., 2.4, 2.6, 4., 0.2, 3.5, 2.5])
+
+        ids = geological_map_to_ids(geological_map)
+        cmap = geological_map_cmap(elements_colors)
+
+        # * Previous per vertex rgb coloring
+        colors_rgb = np.array([mcolors.hex2color(color) for color in elements_colors])
+        expected = colors_rgb[np.round(geological_map).astype(int) - 1]
+
+        assert ids.dtype == np.uint8
+        np.testing.assert_allclose(cmap(ids)[:, :3], expected)
+
+    def test_topography_to_polydata_matches_structured_grid(self):
+        import pyvista as pv
+        from gempy.core.data.grid_modules import Topography, RegularGrid
+        from gempy_viewer.modules.plot_3d.drawer_topography_3d import topography_to_polydata, get_topography_mesh
+        from gempy_viewer.modules.plot_3d.vista import GemPyToVista
+
+        regular_grid = RegularGrid(extent=np.array([0, 2000, 0, 1000, 0, 1000.]), resolution=np.array([5, 5, 5]))
+        xx, yy = np.meshgrid(np.linspace(0, 2000, 30), np.linspace(0, 1000, 20), indexing='ij')
+        height = np.random.default_rng(1234).uniform(200, 800, size=xx.shape)
+        topography = Topography(_regular_grid=regular_grid, values_2d=np.stack((xx, yy, height), axis=-1))
+
+        grid_y, grid_x = np.meshgrid(topography.y, topography.x)
+        expected = pv.StructuredGrid(grid_x, grid_y, topography.values_2d[:, :, 2]).extract_surface(algorithm="dataset_surface")
+        polydata = topography_to_polydata(topography)
+
+        np.testing.assert_array_equal(polydata.points, expected.points)
+        np.testing.assert_array_equal(polydata.faces, expected.faces)
+        np.testing.assert_array_equal(polydata['height'], topography.values[:, 2])
+
+        gempy_vista = GemPyToVista(extent=regular_grid.extent, pyvista_camera_kwargs={}, off_screen=True)
+        assert get_topography_mesh(gempy_vista, topography) is get_topography_mesh(gempy_vista, topography)
+        gempy_vista.p.close()
+
+    def test_adaptive_topography_tiles(self):
+        from gempy.core.data.grid_modules import Topography, RegularGrid
+        from gempy_viewer.modules.plot_3d.drawer_topography_3d import plot_adaptive_topography, geological_map_to_ids
+        from gempy_viewer.modules.plot_3d.vista import GemPyToVista
+
+        regular_grid = RegularGrid(extent=np.array([0, 2000, 0, 1000, 0, 1000.]), resolution=np.array([5, 5, 5]))
+        xx, yy = np.meshgrid(np.linspace(0, 2000, 40), np.linspace(0, 1000, 25), indexing='ij')
+        height = 600 + 200 * np.sin(xx / 300) * np.cos(yy / 400)
+        topography = Topography(_regular_grid=regular_grid, values_2d=np.stack((xx, yy, height), axis=-1))
+        ids = geological_map_to_ids((height > 600).ravel() + 1.)
+
+        gempy_vista = GemPyToVista(extent=regular_grid.extent, pyvista_camera_kwargs={}, off_screen=True)
+        plot_adaptive_topography(gempy_vista, topography, ids=ids, kwargs_add_mesh=dict(scalars='id'), tile_size=9)
+
+        tiles = gempy_vista.topography_tiles
+        assert sum(tile.levels[0].n_cells for tile in tiles) == 39 * 24
+        for tile in tiles:
+            assert tile.errors[0] == 0
+            assert np.all(np.diff(tile.errors) >= 0)
+            for level in tile.levels:
+                # * Every level keeps the geological map id of the vertices it samples
+                i = np.rint(level.points[:, 0] / (2000 / 39)).astype(int)
+                j = np.rint(level.points[:, 1] / (1000 / 24)).astype(int)
+                np.testing.assert_array_equal(level['id'], ids[i * 25 + j])
+
+        gempy_vista.p.show(auto_close=False)
+        gempy_vista.p.camera.position = (1000, 500, 1e7)
+        gempy_vista.p.render()
+        assert all(tile.actor.mapper.dataset is tile.levels[-1] for tile in tiles)
+
+        gempy_vista.p.camera.position = (1000, 500, 900)
+        gempy_vista.p.render()
+        assert any(tile.actor.mapper.dataset is tile.levels[0] for tile in tiles)
+        gempy_vista.p.close()
+
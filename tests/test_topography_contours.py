@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from gempy.core.data.grid_modules import RegularGrid, Topography
+
+from gempy_viewer.core.topography_contours import get_topography_contours, topography_contours_cache, \
+    clear_topography_contours_cache, topography_key
+from gempy_viewer.modules.plot_3d.drawer_topography_3d import contour_lines_to_polydata
+
+
+def _dome_topography():
+    regular_grid = RegularGrid(extent=np.array([0, 100, 0, 50, 0, 100]), resolution=np.array([10, 5, 10]))
+    x, y = np.meshgrid(np.linspace(0, 100, 41), np.linspace(0, 50, 21), indexing='ij')
+    z = 80 - 0.01 * ((x - 50) ** 2 + (y - 25) ** 2)
+    return Topography(_regular_grid=regular_grid, values_2d=np.stack([x, y, z], axis=2))
+
+
+def test_topography_contours_cached_by_values_and_levels():
+    clear_topography_contours_cache()
+    topography = _dome_topography()
+    hits, misses = topography_contours_cache.hits, topography_contours_cache.misses
+
+    levels, lines = get_topography_contours(topography, interval=10)
+    assert levels.tolist() == [50., 60., 70.]
+    assert get_topography_contours(topography, interval=10)[1] is lines
+    assert (topography_contours_cache.hits, topography_contours_cache.misses) == (hits + 1, misses + 1)
+
+    # * Same heights in a new object still hit, other levels miss
+    get_topography_contours(_dome_topography(), levels=[50, 60, 70])
+    get_topography_contours(topography, levels=[75])
+    assert (topography_contours_cache.hits, topography_contours_cache.misses) == (hits + 2, misses + 2)
+
+    # * Closed circles around the top of the dome
+    for level, lines_of_level in zip(levels[1:], lines[1:]):
+        radius = np.sqrt((80 - level) / 0.01)
+        xy = np.concatenate(lines_of_level)
+        np.testing.assert_allclose(np.hypot(xy[:, 0] - 50, xy[:, 1] - 25), radius, rtol=0.05)
+
+
+def test_contour_lines_to_polydata():
+    clear_topography_contours_cache()
+    levels, lines = get_topography_contours(_dome_topography(), interval=10)
+    polydata = contour_lines_to_polydata(levels, lines)
+
+    assert polydata.n_lines == sum(len(lines_of_level) for lines_of_level in lines)
+    assert set(np.unique(polydata['height'])) == {50., 60., 70.}
+    np.testing.assert_array_equal(polydata.points[:, 2], polydata['height'])
+    assert contour_lines_to_polydata(np.array([]), []).n_points == 0
+
+
+def test_flat_topography_has_no_contours():
+    clear_topography_contours_cache()
+    topography = _dome_topography()
+    topography.values_2d[:, :, 2] = 42.
+
+    levels, lines = get_topography_contours(topography)
+    assert len(levels) == 0 and lines == []
+    assert contour_lines_to_polydata(levels, lines).n_points == 0
+
+    with pytest.raises(ValueError):
+        get_topography_contours(topography, interval=0)
+    with pytest.raises(ValueError):
+        get_topography_contours(topography, interval=-10)
+
+
+def test_topography_key_hashed_once_per_array():
+    import gc
+    import weakref
+    from unittest import mock
+    from gempy_viewer.core import topography_contours
+
+    clear_topography_contours_cache()
+    topography = _dome_topography()
+
+    with mock.patch.object(topography_contours, '_hash_values', wraps=topography_contours._hash_values) as hash_values:
+        key = topography_key(topography)
+        assert topography_key(topography) == key
+        get_topography_contours(topography, interval=10)
+        assert hash_values.call_count == 1
+
+    # * Equal heights in another array share the key, other heights do not
+    assert topography_key(_dome_topography()) == key
+    flat = _dome_topography()
+    flat.values_2d[:, :, 2] = 42.
+    assert topography_key(flat) != key
+
+    # * Heights edited in place, even only moved around, get a new key
+    topography.values_2d[:, :, 2] += 0.1 * topography.values_2d[:, :, 1]
+    edited_key = topography_key(topography)
+    assert edited_key != key
+    topography.values_2d[:, :, 2] = topography.values_2d[:, ::-1, 2].copy()
+    assert topography_key(topography) not in (key, edited_key)
+
+    # * The memo does not keep the DEMs alive
+    values_ref = weakref.ref(flat.values_2d)
+    del flat
+    gc.collect()
+    assert values_ref() is None
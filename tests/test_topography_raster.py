@@ -0,0 +1,50 @@
+import numpy as np
+from matplotlib.colors import LightSource
+
+from gempy.core.data.grid_modules import RegularGrid, Topography
+
+from gempy_viewer.core.topography_raster import (topography_heights, topography_hillshade, topography_raster_cache,
+                                                 clear_topography_raster_cache)
+
+
+def _slope_topography(nx=30, ny=20):
+    regular_grid = RegularGrid(extent=np.array([0, 300, 0, 200, 0, 100]), resolution=np.array([10, 5, 10]))
+    x, y = np.meshgrid(np.linspace(0, 300, nx), np.linspace(0, 200, ny), indexing='ij')
+    return Topography(_regular_grid=regular_grid, values_2d=np.stack([x, y, 0.1 * x + 0.2 * y], axis=2))
+
+
+def test_topography_heights_resampled_to_target_and_memoized():
+    clear_topography_raster_cache()
+    topography = _slope_topography()
+    hits, misses = topography_raster_cache.hits, topography_raster_cache.misses
+
+    heights = topography_heights(topography, (120, 80))
+    assert heights.shape == (80, 120)
+    np.testing.assert_allclose(heights[[0, -1], [0, -1]], [0, 70], atol=1)
+    assert topography_heights(topography, (120, 80)) is heights
+    assert (topography_raster_cache.hits, topography_raster_cache.misses) == (hits + 1, misses + 1)
+
+
+def test_topography_heights_not_resampled_when_dense_enough():
+    topography = _slope_topography()
+    np.testing.assert_array_equal(topography_heights(topography), topography.values_2d[:, :, 2].T)
+    assert topography_heights(topography, (25, 10)).shape == (20, 30)
+
+    # * Never downsampled along one axis while the other one is upsampled
+    assert topography_heights(topography, (10, 40)).shape == (40, 30)
+
+
+def test_topography_hillshade_float32_and_shared():
+    clear_topography_raster_cache()
+    topography = _slope_topography()
+    topography.values_2d[:, :, 2] += np.sin(topography.values_2d[:, :, 0] / 20) * 10
+
+    hillshade = topography_hillshade(topography, azdeg=315, altdeg=45)
+    assert hillshade.dtype == np.float32
+    reference = LightSource(azdeg=315, altdeg=45).hillshade(topography.values_2d[:, :, 2].T)
+    np.testing.assert_allclose(hillshade, reference, atol=1e-5)
+
+    assert topography_hillshade(_slope_topography(), azdeg=315, altdeg=45) is not hillshade
+    assert topography_hillshade(topography, azdeg=315, altdeg=45) is hillshade
+    assert topography_hillshade(topography, azdeg=0, altdeg=45) is not hillshade
+    assert topography_hillshade(topography, azdeg=315, altdeg=45, dtype=np.float64).dtype == np.float64
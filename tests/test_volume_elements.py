@@ -1,7 +1,10 @@
 """Verify the volume element properties and ID remapping work correctly."""
 import numpy as np
+import pytest
 from gempy.core.data import GeoModel
 
+from gempy_viewer.modules.plot_3d.drawer_structured_grid_3d import lith_block_to_ids
+
 
 def test_volume_elements_properties(one_fault_model_topo_solution: GeoModel):
     sf = one_fault_model_topo_solution.structural_frame
@@ -40,3 +43,28 @@ def test_lith_block_remapping(one_fault_model_topo_solution: GeoModel):
     assert np.array_equal(unique_vals, np.array([2, 3, 4]))
     assert lith_to_id == {2: 1, 3: 2, 4: 3}
     assert np.array_equal(np.unique(block_), np.array([1, 2, 3]))
+
+    ids = lith_block_to_ids(raw.lith_block)
+    assert np.array_equal(ids, block_)
+    assert ids.dtype == raw.lith_block.dtype
+
+
+@pytest.mark.parametrize("values, dtype", [
+    ([2, 3, 4], np.int8),
+    ([-5, 0, 7, 120], np.int16),
+    ([1.0, 2.0, 5.0], np.float64),
+    ([3, 1_000_000, 20_000_000], np.int64),  # * Sparse values go through searchsorted
+])
+def test_lith_block_to_ids_matches_dict_remapping(values, dtype):
+    rng = np.random.default_rng(1234)
+    lith_block = rng.choice(np.array(values, dtype=dtype), size=10_000)
+
+    unique_vals = np.sort(np.unique(lith_block))
+    lith_to_id = {int(v): i + 1 for i, v in enumerate(unique_vals)}
+    expected = np.array([lith_to_id[int(v)] for v in lith_block.ravel()])
+
+    ids = lith_block_to_ids(lith_block, chunk_size=999)
+    assert np.array_equal(ids, expected)
+    assert np.issubdtype(ids.dtype, np.integer)
+    if np.issubdtype(dtype, np.integer):
+        assert ids.dtype == dtype